@@ -1,3 +1,3 @@
-from .registry import SyntaxRegistry, load_all_languages
+from .registry import SyntaxRegistry, load_all_languages, get_registry
 
-__all__ = ["SyntaxRegistry", "load_all_languages"]
+__all__ = ["SyntaxRegistry", "load_all_languages", "get_registry"]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, Callable, Optional, List
 import json, re
 from pathlib import Path
@@ -87,3 +88,8 @@ def load_all_languages():
         except Exception:
             continue
     return registry
+
+@lru_cache(maxsize=1)
+def get_registry() -> SyntaxRegistry:
+    """Shared registry, loaded on first use."""
+    return load_all_languages()
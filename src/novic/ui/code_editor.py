@@ -1,20 +1,55 @@
 from __future__ import annotations
-from PySide6.QtCore import Qt, QRect, QSize, QTimer
-from PySide6.QtGui import QColor, QPainter, QTextFormat, QGuiApplication, QSyntaxHighlighter, QTextCharFormat
-
-# Lazy import holder for syntax to avoid cost if unused
-try:
-    from novic.syntax import SyntaxRegistry, load_all_languages
-    _SYNTAX_REGISTRY = load_all_languages()
-except Exception:  # pragma: no cover - syntax not critical
-    _SYNTAX_REGISTRY = None
+import bisect
+from collections import OrderedDict
+from PySide6.QtCore import Qt, QRect, QSize, QTimer, QEvent, QPointF, QObject, QRunnable, QThreadPool, Signal
+from PySide6.QtGui import QColor, QPainter, QPen, QTextFormat, QGuiApplication, QSyntaxHighlighter, QTextCharFormat, QTextCursor, QStaticText
+
 from PySide6.QtWidgets import QPlainTextEdit, QWidget, QTextEdit
 
 
+def _syntax_registry():
+    # Language definitions load on first use, not at import
+    try:
+        from novic.syntax import get_registry
+        return get_registry()
+    except Exception:  # pragma: no cover - syntax not critical
+        return None
+
+
+# Modifiers that alter wheel speed; checked once so the common (no modifier) path is one test
+_WHEEL_MODIFIER_MASK = Qt.ShiftModifier | Qt.AltModifier
+# Wheel math is done in Q10 fixed point (1/1024 units) to avoid float round trips
+_WHEEL_Q = 10
+_WHEEL_ONE = 1 << _WHEEL_Q
+# Lines-per-notch multiplier (Q10) keyed by the masked modifiers (Shift wins when both are held)
+_WHEEL_SPEED_FACTORS = {
+    Qt.ShiftModifier: 3 * _WHEEL_ONE,  # fast scroll
+    Qt.AltModifier: _WHEEL_ONE // 2,  # slow scroll
+    Qt.ShiftModifier | Qt.AltModifier: 3 * _WHEEL_ONE,
+}
+
+# Gutter background (opaque, matches the editor background)
+_LN_BG = QColor('#1f2123')
+# Current line highlight background
+_CURRENT_LINE_BG = QColor('#2d3135')
+# setPlainText() above this many characters loads with signals/updates suspended
+_BULK_LOAD_THRESHOLD = 50_000
+# Above this many characters the highlighter is detached from the document entirely
+_HIGHLIGHT_MAX_CHARS = 500_000
+# Upper bound on cached line-number labels (oldest entries are evicted first)
+_LN_CACHE_MAX = 2048
+# Characters lexed on each side of the visible region
+_LEX_CONTEXT = 2000
+
+
 class _LineNumberArea(QWidget):
     def __init__(self, editor: 'CodeEditor'):
         super().__init__(editor)
         self._editor = editor
+        # _paint_line_numbers fills the whole exposed rect; skip Qt's background erase
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)
+        self.setAttribute(Qt.WA_NoSystemBackground, True)
+        self.setAutoFillBackground(False)
 
     def sizeHint(self):  # type: ignore[override]
         return QSize(self._editor.line_number_area_width(), 0)
@@ -40,6 +75,22 @@ class CodeEditor(QPlainTextEdit):
         self._last_left_margin = -1
         self._last_bottom_margin = -1
         self._in_resize = False
+        # gutter width memo: (block count, digit advance, width)
+        self._gutter_cache = (-1, -1, -1)
+        self._digit_advance = self.fontMetrics().horizontalAdvance('9')
+        # (scrollbar value, first visible block number, its top y) reused across gutter paints
+        self._paint_cache = (None, None, None)
+        # line number -> pre-laid-out label, so scrolling does not re-shape digits every paint
+        self._static_numbers: OrderedDict[int, QStaticText] = OrderedDict()
+        # gutter pens, built once instead of per paint
+        self._ln_pen = QPen(QColor('#7d848a'))
+        self._ln_active_pen = QPen(QColor('#cfd2d6'))
+        # current-line highlight key: block number + whether the long-line variant is used
+        self._last_hl_block = -1
+        self._last_hl_wide = False
+        # the one current-line selection, re-pointed at the cursor instead of rebuilt
+        self._line_sel = QTextEdit.ExtraSelection()
+        self._line_sel.format.setBackground(_CURRENT_LINE_BG)
         # syntax state
         self._active_language = None
         self._highlighter = _SyntaxHighlighter(self.document())
@@ -53,8 +104,11 @@ class CodeEditor(QPlainTextEdit):
             system_lines = 3
         self._base_wheel_lines = float(system_lines)
         self._wheel_lines_per_notch = self._base_wheel_lines
-        self._wheel_accum = 0.0
-        self.verticalScrollBar().setSingleStep(self.fontMetrics().height())
+        self._lines_per_notch_q = int(self._wheel_lines_per_notch * _WHEEL_ONE)
+        self._wheel_accum_q = 0  # sub-pixel remainder, Q10
+        # font-derived metrics, refreshed in _on_font_changed
+        self._space_advance = 0
+        self._fm_height = self.fontMetrics().height()
 
         # ---- performance hints ----
         self.setLineWrapMode(QPlainTextEdit.NoWrap)
@@ -71,13 +125,23 @@ class CodeEditor(QPlainTextEdit):
         except Exception:
             pass
 
-        self.setTabStopDistance(self.fontMetrics().horizontalAdvance(' ') * 4)
+        if not self._space_advance:
+            # setFont() was a no-op (same font); metrics still need an initial pass
+            self._on_font_changed()
+
+        # textChanged fires per edit (hundreds of times for a paste/undo of many lines);
+        # the follow-up work runs once per event loop pass instead
+        self._edit_coalesce = QTimer(self)
+        self._edit_coalesce.setSingleShot(True)
+        self._edit_coalesce.setInterval(0)
+        self._edit_coalesce.timeout.connect(self._apply_edit)
 
         # ---- signals ----
         self.blockCountChanged.connect(self._on_block_count_changed)
         self.updateRequest.connect(self._on_update_request)
         self.cursorPositionChanged.connect(self._highlight_current_line)
         self.textChanged.connect(self._on_text_changed)
+        self.verticalScrollBar().valueChanged.connect(self._on_scroll_value_changed)
 
         # ---- initial visuals ----
         self._apply_margins()
@@ -88,12 +152,13 @@ class CodeEditor(QPlainTextEdit):
 
     # ---- geometry & margins -------------------------------------------
     def line_number_area_width(self) -> int:
-        digits = 1
-        max_block = max(1, self.blockCount())
-        while max_block >= 10:
-            max_block //= 10
-            digits += 1
-        return 8 + self.fontMetrics().horizontalAdvance('9') * digits
+        count = self.blockCount()
+        cached_count, cached_advance, cached_width = self._gutter_cache
+        if count == cached_count and self._digit_advance == cached_advance:
+            return cached_width
+        width = 8 + self._digit_advance * len(str(max(1, count)))
+        self._gutter_cache = (count, self._digit_advance, width)
+        return width
 
     def _apply_margins(self):
         left = self.line_number_area_width()
@@ -120,12 +185,33 @@ class CodeEditor(QPlainTextEdit):
         self._in_resize = True
         try:
             super().resizeEvent(event)
+            self._paint_cache = (None, None, None)
             # No overscroll adjustments; just ensure margins reflect gutter width.
             self._apply_margins()
         finally:
             self._in_resize = False
 
+    def changeEvent(self, event):  # type: ignore[override]
+        super().changeEvent(event)
+        if event.type() == QEvent.FontChange:
+            self._on_font_changed()
+
+    def _on_font_changed(self):
+        # Shaping calls are comparatively expensive; do them once per font change only.
+        fm = self.fontMetrics()
+        self._space_advance = fm.horizontalAdvance(' ')
+        self.setTabStopDistance(self._space_advance * 4)
+        self._digit_advance = fm.horizontalAdvance('9')
+        self._fm_height = fm.height()
+        self.verticalScrollBar().setSingleStep(self._fm_height)
+        self._paint_cache = (None, None, None)
+        self._static_numbers.clear()
+        # gutter width depends on digit advance
+        self._apply_margins()
+        self._line_number_area.update()
+
     def _on_block_count_changed(self, _):
+        self._paint_cache = (None, None, None)
         self._apply_margins()
         # block count changes may affect scroll height – overscroll recalculated
         self._recalc_overscroll()
@@ -140,76 +226,169 @@ class CodeEditor(QPlainTextEdit):
     # ---- painting ------------------------------------------------------
     def _paint_line_numbers(self, event):
         painter = QPainter(self._line_number_area)
-        # Explicitly paint gutter background to avoid uninitialized artifacts on some systems
-        painter.fillRect(event.rect(), QColor('#1f2123'))
-        block = self.firstVisibleBlock()
-        block_number = block.blockNumber()
-        top = int(self.blockBoundingGeometry(block).translated(self.contentOffset()).top())
-        bottom = top + int(self.blockBoundingRect(block).height())
-        fm = self.fontMetrics()
-        ln_color = QColor('#7d848a')
-        active_color = QColor('#cfd2d6')
+        # Keep every op inside the exposed region so partial updates stay partial
+        painter.setClipRect(event.rect())
+        # Explicitly paint gutter background to avoid uninitialized artifacts on some systems.
+        # The color is opaque, so Source mode lets the raster engine skip blending.
+        painter.setCompositionMode(QPainter.CompositionMode_Source)
+        painter.fillRect(event.rect(), _LN_BG)
+        painter.setCompositionMode(QPainter.CompositionMode_SourceOver)
+        # Rapid-fire paints at the same scroll position share the first-block geometry
+        sv = self.verticalScrollBar().value()
+        cached_sv, block_number, top = self._paint_cache
+        if sv == cached_sv:
+            block = self.document().findBlockByNumber(block_number)
+        else:
+            block = self.firstVisibleBlock()
+            block_number = block.blockNumber()
+            top = int(self.blockBoundingGeometry(block).translated(self.contentOffset()).top())
+            self._paint_cache = (sv, block_number, top)
+        # Unwrapped blocks are exactly one line tall: measure the first one and step by it
+        # instead of asking the layout for every block's bounding rect.
+        fixed_h = int(self.blockBoundingRect(block).height()) if self.lineWrapMode() == QPlainTextEdit.NoWrap else 0
+        bottom = top + (fixed_h or int(self.blockBoundingRect(block).height()))
+        ln_pen = self._ln_pen
+        active_pen = self._ln_active_pen
+        painter.setPen(ln_pen)
         width = self._line_number_area.width() - 6
         viewport_bottom = event.rect().bottom()
         cursor_block = self.textCursor().blockNumber()
+        static_numbers = self._static_numbers
 
         while block.isValid() and top <= viewport_bottom:
             if block.isVisible() and bottom >= event.rect().top():
-                number = str(block_number + 1)
-                painter.setPen(active_color if block_number == cursor_block else ln_color)
-                painter.drawText(0, top, width, fm.height(), Qt.AlignRight | Qt.AlignVCenter, number)
+                st = static_numbers.get(block_number)
+                if st is None:
+                    st = self._make_static_number(block_number)
+                else:
+                    static_numbers.move_to_end(block_number)
+                # right aligned; labels are laid out at line height so top == text top
+                active = block_number == cursor_block
+                if active:
+                    painter.setPen(active_pen)
+                painter.drawStaticText(QPointF(width - st.size().width(), top), st)
+                if active:
+                    painter.setPen(ln_pen)
             block = block.next()
             block_number += 1
             top = bottom
-            bottom = top + int(self.blockBoundingRect(block).height())
+            bottom = top + (fixed_h or int(self.blockBoundingRect(block).height()))
+
+    def _make_static_number(self, block_number: int) -> QStaticText:
+        cache = self._static_numbers
+        if len(cache) >= _LN_CACHE_MAX:
+            # hits are moved to the end while painting; drop the least recently used label
+            cache.popitem(last=False)
+        st = QStaticText(str(block_number + 1))
+        st.setTextFormat(Qt.PlainText)
+        st.prepare(font=self.font())
+        cache[block_number] = st
+        return st
 
     # ---- highlight current line ---------------------------------------
     def _highlight_current_line(self):
         # Only current line background (syntax colors handled by highlighter)
         if self.isReadOnly():
             self.setExtraSelections([])
+            self._last_hl_block = -1
             return
-        line_sel = QTextEdit.ExtraSelection()
-        line_sel.format.setBackground(QColor('#2d3135'))
-        line_sel.format.setProperty(QTextFormat.FullWidthSelection, True)
-        line_sel.cursor = self.textCursor()
-        line_sel.cursor.clearSelection()
+        cursor = self.textCursor()
+        block = cursor.blockNumber()
+        wide = self.horizontalScrollBar().maximum() > 0
+        if block == self._last_hl_block and wide == self._last_hl_wide:
+            # Same line as before: the existing extra selection tracks edits on its own
+            return
+        line_sel = self._line_sel
+        line_sel.cursor = cursor
+        if wide:
+            # Long lines: a full-width selection would invalidate the whole (wide) viewport
+            # row on every cursor move; limit the highlight to the line's own text instead.
+            line_sel.cursor.select(QTextCursor.LineUnderCursor)
+        else:
+            line_sel.cursor.clearSelection()
+        if wide != self._last_hl_wide or self._last_hl_block < 0:
+            line_sel.format.setProperty(QTextFormat.FullWidthSelection, not wide)
         self.setExtraSelections([line_sel])
+        self._last_hl_block = block
+        self._last_hl_wide = wide
 
     # ---- convenience ---------------------------------------------------
     def setPlainText(self, text: str):  # type: ignore[override]
-        super().setPlainText(text)
+        # New document: force the current-line highlight to be rebuilt
+        self._last_hl_block = -1
+        if len(text) > _BULK_LOAD_THRESHOLD:
+            # Large buffer: load without per-change signals, repaints, undo capture or
+            # highlighting, then do the follow-up work once below.
+            self.setUpdatesEnabled(False)
+            self.setUndoRedoEnabled(False)
+            was_blocked = self.blockSignals(True)
+            self._highlighter.detach()
+            try:
+                super().setPlainText(text)
+            finally:
+                if len(text) <= _HIGHLIGHT_MAX_CHARS:
+                    self._highlighter.attach()
+                self.blockSignals(was_blocked)
+                self.setUndoRedoEnabled(True)
+                self.setUpdatesEnabled(True)
+            self._paint_cache = (None, None, None)
+            self._highlight_current_line()
+            self._line_number_area.update()
+        else:
+            super().setPlainText(text)
+            # a previous (huge) buffer may have left the highlighter detached
+            self._highlighter.attach()
         self.document().setModified(False)
         self._apply_margins()
         self._recalc_overscroll()
         # rehighlight if language active
         if self._active_language:
-            self._highlighter.schedule_refresh(self._active_language)
+            self._highlighter.schedule_refresh(self._active_language, vis=self._visible_range())
 
     # ---- syntax highlighting API -------------------------------------
+    def activeLanguage(self):
+        """The language currently used for highlighting, or None for plain text."""
+        return self._active_language
+
     def applySyntaxByName(self, name: str):
-        if not _SYNTAX_REGISTRY:
+        reg = _syntax_registry()
+        if not reg:
             return
-        lang = _SYNTAX_REGISTRY.get(name)
+        lang = reg.get(name)
         if not lang:
             return
         self._active_language = lang
-        self._highlighter.schedule_refresh(lang, immediate=True)
+        self._highlighter.schedule_refresh(lang, immediate=True, vis=self._visible_range())
 
     def applySyntaxForExtension(self, ext: str):
-        if not _SYNTAX_REGISTRY:
+        reg = _syntax_registry()
+        if not reg:
             return
-        lang = _SYNTAX_REGISTRY.get_for_extension(ext)
+        lang = reg.get_for_extension(ext)
         if not lang:
             return
         self._active_language = lang
-        self._highlighter.schedule_refresh(lang, immediate=True)
+        self._highlighter.schedule_refresh(lang, immediate=True, vis=self._visible_range())
 
     def _on_text_changed(self):
+        if not self._edit_coalesce.isActive():
+            self._edit_coalesce.start()
+
+    def _apply_edit(self):
         if self._active_language:
-            self._highlighter.schedule_refresh(self._active_language)
+            self._highlighter.schedule_refresh(self._active_language, vis=self._visible_range())
         self._highlight_current_line()
 
+    def _visible_range(self) -> tuple[int, int]:
+        """Document positions of the first and last visible characters."""
+        lo = self.firstVisibleBlock().position()
+        hi = self.cursorForPosition(self.viewport().rect().bottomLeft()).position()
+        return lo, max(lo, hi)
+
+    def _on_scroll_value_changed(self, _):
+        if self._active_language:
+            self._highlighter.request_window(self._visible_range())
+
     # ---- lightweight wheel handling (no animation) -------------------
     def wheelEvent(self, event):  # type: ignore[override]
         # Pixel based (high-res trackpad) -> default for natural smoothness
@@ -218,26 +397,30 @@ class CodeEditor(QPlainTextEdit):
         delta_y = event.angleDelta().y()
         if delta_y == 0:
             return super().wheelEvent(event)
+        # Hoist per-event attribute lookups into locals (runs on every notch)
         sb = self.verticalScrollBar()
-        line_h = self.fontMetrics().height()
+        line_h = self._fm_height
         # Determine effective lines per notch (modifiers emulate VSCode style acceleration)
-        lines_per_notch = self._wheel_lines_per_notch
+        lines_per_notch_q = self._lines_per_notch_q
         mods = event.modifiers()
-        if mods & Qt.ShiftModifier:  # fast scroll
-            lines_per_notch *= 3.0
-        elif mods & Qt.AltModifier:  # slow scroll
-            lines_per_notch = max(1.0, lines_per_notch * 0.5)
-
-        # Compute fractional pixel movement for fine control
-        delta_lines = -(delta_y / 120.0) * lines_per_notch
-        pixels = delta_lines * line_h + self._wheel_accum
-        step = int(pixels)
-        self._wheel_accum = pixels - step
+        if mods & _WHEEL_MODIFIER_MASK:
+            factor_q = _WHEEL_SPEED_FACTORS[mods & _WHEEL_MODIFIER_MASK]
+            lines_per_notch_q = (lines_per_notch_q * factor_q) >> _WHEEL_Q
+            if factor_q < _WHEEL_ONE:  # never slow below one line per notch
+                lines_per_notch_q = max(_WHEEL_ONE, lines_per_notch_q)
+
+        # Fixed-point pixel movement; the sub-pixel remainder carries to the next notch
+        pixels_q = (-delta_y * lines_per_notch_q * line_h) // 120 + self._wheel_accum_q
+        step = pixels_q >> _WHEEL_Q
+        self._wheel_accum_q = pixels_q - (step << _WHEEL_Q)
         if step == 0:
             # Nothing whole to apply this event; accumulate remainder for next wheel
             event.accept()
             return
-        sb.setValue(max(sb.minimum(), min(sb.maximum(), sb.value() + step)))
+        value = sb.value() + step
+        lo = sb.minimum()
+        hi = sb.maximum()
+        sb.setValue(lo if value < lo else hi if value > hi else value)
         event.accept()
 
     # Public API to adjust scroll speed at runtime
@@ -257,26 +440,186 @@ class CodeEditor(QPlainTextEdit):
             self._wheel_lines_per_notch = self._base_wheel_lines
         elif lines and lines > 0:
             self._wheel_lines_per_notch = float(lines)
-        self._wheel_accum = 0.0
+        self._lines_per_notch_q = int(self._wheel_lines_per_notch * _WHEEL_ONE)
+        self._wheel_accum_q = 0
 
 
 __all__ = ["CodeEditor"]
 
 
+def _changed_spans(old: list[tuple], new: list[tuple], delta: int) -> list[tuple[int, int]]:
+    """Return (lo, hi) character spans, in new document coordinates, covering every
+    token that differs between two lexer passes (empty if they are equivalent).
+
+    Tokens before the edit compare as-is; tokens after it compare with the old
+    positions shifted by ``delta`` (the change in document length). When the passes
+    cover different amounts of text (token cap / sample cut), only the common part is
+    compared and the gap between the two coverage ends is reported separately.
+    """
+    spans: list[tuple[int, int]] = []
+    n_old = len(old)
+    n_new = len(new)
+    if n_old and n_new:
+        end_new = new[-1][3]
+        end_old = old[-1][3] + delta
+        if end_new != end_old:
+            bound = min(end_new, end_old)
+            spans.append((bound, max(end_new, end_old)))
+            while n_new and new[n_new - 1][3] > bound:
+                n_new -= 1
+            while n_old and old[n_old - 1][3] + delta > bound:
+                n_old -= 1
+    limit = min(n_old, n_new)
+    i = 0
+    while i < limit:
+        a = old[i]
+        b = new[i]
+        if a[0] != b[0] or a[2] != b[2] or a[3] != b[3]:
+            break
+        i += 1
+    k = 0
+    limit -= i
+    while k < limit:
+        a = old[n_old - 1 - k]
+        b = new[n_new - 1 - k]
+        if a[0] != b[0] or a[2] + delta != b[2] or a[3] + delta != b[3]:
+            break
+        k += 1
+    lo = hi = None
+    for t in new[i:n_new - k]:
+        lo = t[2] if lo is None else min(lo, t[2])
+        hi = t[3] if hi is None else max(hi, t[3])
+    for t in old[i:n_old - k]:
+        # old tokens may sit before or after the edit; cover both placements
+        s = min(t[2], t[2] + delta)
+        e = max(t[3], t[3] + delta)
+        lo = s if lo is None else min(lo, s)
+        hi = e if hi is None else max(hi, e)
+    if lo is not None:
+        spans.append((max(0, lo), hi))
+    return spans
+
+
+def _block_token_ranges(text: str, tokens: list[tuple]) -> list[tuple[int, int]]:
+    """Map block number -> (first, stop) token indexes for the blocks of ``text``.
+
+    Blocks are the newline separated lines of the snapshot; the list ends at the last
+    block that any token reaches (later blocks have no tokens).
+    """
+    ranges: list[tuple[int, int]] = []
+    if not tokens:
+        return ranges
+    n = len(tokens)
+    covered = tokens[-1][3]
+    first = 0
+    block_start = 0
+    while block_start <= covered:
+        block_end = text.find('\n', block_start)
+        if block_end < 0:
+            block_end = len(text)
+        while first < n and tokens[first][3] <= block_start:
+            first += 1
+        stop = first
+        while stop < n and tokens[stop][2] < block_end:
+            stop += 1
+        ranges.append((first, stop))
+        block_start = block_end + 1
+    return ranges
+
+
+def _build_formats(style) -> dict[str, QTextCharFormat]:
+    """Prepare one QTextCharFormat per styled token kind."""
+    formats: dict[str, QTextCharFormat] = {}
+    if not isinstance(style, dict):
+        return formats
+    for kind, spec in style.items():
+        color = spec.get('color') if isinstance(spec, dict) else None
+        if color:
+            fmt = QTextCharFormat()
+            fmt.setForeground(QColor(color))
+            formats[kind] = fmt
+    return formats
+
+
+class _LexSignals(QObject):
+    # generation, tokens, token start offsets, block -> token index ranges
+    resultReady = Signal(int, object, object, object)
+
+
+class _LexJob(QRunnable):
+    """Runs a language lexer over a text snapshot on a pool thread.
+
+    ``sample`` starts at document position ``base``; emitted token offsets are shifted
+    back to document coordinates, block ranges stay relative to the sample's first block.
+    """
+
+    def __init__(self, lexer, sample: str, base: int, generation: int, signals: _LexSignals):
+        super().__init__()
+        self._lexer = lexer
+        self._sample = sample
+        self._base = base
+        self._generation = generation
+        self._signals = signals
+
+    def run(self):  # type: ignore[override]
+        try:
+            tokens = self._lexer(self._sample)[:4000]
+        except Exception:
+            tokens = []
+        ranges = _block_token_ranges(self._sample, tokens)
+        base = self._base
+        if base:
+            tokens = [(kind, val, start + base, end + base) for kind, val, start, end in tokens]
+        starts = [t[2] for t in tokens]
+        try:
+            # queued back to the GUI thread (receiver lives there)
+            self._signals.resultReady.emit(self._generation, tokens, starts, ranges)
+        except RuntimeError:  # signals object already torn down (application exiting)
+            pass
+
+
 class _SyntaxHighlighter(QSyntaxHighlighter):
-    """Simple syntax highlighter with debounced lexing and block-local formatting."""
+    """Simple syntax highlighter with debounced lexing and block-local formatting.
+
+    Lexing runs on the global QThreadPool; results are applied on the GUI thread and
+    dropped if the document changed while the job was running. Only the visible region
+    plus some context is lexed; scrolling outside it re-lexes the new window.
+    """
 
     def __init__(self, doc):
         super().__init__(doc)
+        self._doc = doc  # kept while detached (document() is None then)
         self._tokens: list[tuple] = []
         self._style: dict = {}
+        # token kind -> prepared char format, rebuilt whenever _style changes
+        self._formats: dict[str, QTextCharFormat] = {}
         self._starts: list[int] = []
+        # block number -> token index range for the current document; None once an edit
+        # shifts blocks (highlightBlock then falls back to bisecting _starts)
+        self._ranges: list[tuple[int, int]] | None = None
+        self._range_base = 0  # block number of the window's first block (_ranges index 0)
+        self._window: tuple[int, int] | None = None  # document span the tokens cover
+        self._vis: tuple[int, int] = (0, 0)  # visible region of the latest request
         self._pending_language = None
         self._debounce_timer: QTimer | None = None
-        self._busy = False
-
-    def schedule_refresh(self, language, immediate: bool = False):
+        self._scroll_timer: QTimer | None = None
+        self._busy = False  # a lex job is in flight
+        # bumped on every schedule and edit; results from older generations are stale
+        self._generation = 0
+        self._job_state: tuple | None = None  # (language, text length, window, first block)
+        self._lex_signals = _LexSignals()
+        self._lex_signals.resultReady.connect(self._on_lex_ready)
+        # state of the last applied refresh, used to limit re-highlighting to changed blocks
+        self._applied_language = None
+        self._text_len = 0
+        self._edit_span: tuple[int, int] | None = None  # union of edits since last refresh
+        doc.contentsChange.connect(self._on_contents_change)
+
+    def schedule_refresh(self, language, immediate: bool = False, vis: tuple[int, int] | None = None):
         self._pending_language = language
+        if vis is not None:
+            self._vis = vis
+        self._generation += 1
         if immediate:
             self._run_refresh()
             return
@@ -287,64 +630,195 @@ class _SyntaxHighlighter(QSyntaxHighlighter):
         # restart timer (150ms debounce)
         self._debounce_timer.start(150)
 
+    def request_window(self, vis: tuple[int, int]):
+        """Re-lex around ``vis`` (debounced) unless the current tokens already cover it."""
+        self._vis = vis
+        window = self._window
+        if window is not None and window[0] <= vis[0] and vis[1] <= window[1]:
+            return
+        if not self._pending_language:
+            return
+        self._generation += 1
+        if self._scroll_timer is None:
+            self._scroll_timer = QTimer()
+            self._scroll_timer.setSingleShot(True)
+            self._scroll_timer.timeout.connect(self._run_refresh)
+        self._scroll_timer.start(100)
+
+    def detach(self):
+        """Stop highlighting: Qt no longer calls highlightBlock for any edit."""
+        if self.document() is not None:
+            self.setDocument(None)
+
+    def attach(self):
+        if self.document() is None:
+            self.setDocument(self._doc)
+
+    def _refresh_pending(self) -> bool:
+        return any(t is not None and t.isActive() for t in (self._debounce_timer, self._scroll_timer))
+
     def _run_refresh(self):
         if self._busy:
-            # avoid re-entrancy; schedule again
-            if self._debounce_timer:
-                self._debounce_timer.start(50)
+            # one job at a time; _on_lex_ready re-runs if this request made it stale
             return
         lang = self._pending_language
         if not lang:
             return
-        self._busy = True
         try:
-            try:
-                text = self.document().toPlainText()
-            except Exception:
-                text = ""
-            # Hard limits to avoid huge regex slowdown
-            if len(text) > 500_000:
-                # Disable highlighting for very large files for stability
-                self._tokens = []
-                self._starts = []
-                self._style = {}
-                self.rehighlight()
-                return
-            sample = text[:50_000]
-            try:
-                tokens = lang.lexer(sample)[:4000]
-            except Exception:
-                tokens = []
-            self._tokens = tokens
-            self._style = getattr(lang, 'style', {}) or {}
-            self._starts = [t[2] for t in self._tokens]
+            text = self._doc.toPlainText()
+        except Exception:
+            text = ""
+        # Hard limits to avoid huge regex slowdown
+        if len(text) > _HIGHLIGHT_MAX_CHARS:
+            # Disable highlighting for very large files for stability; detaching also
+            # clears existing formats and keeps Qt from re-formatting blocks on each edit
+            self._text_len = len(text)
+            self._edit_span = None
+            self._tokens = []
+            self._starts = []
+            self._ranges = None
+            self._window = None
+            self._style = {}
+            self._formats = {}
+            self._applied_language = None
+            self.detach()
+            return
+        self.attach()
+        # Lex the visible region plus context, widened to whole blocks so the lexer never
+        # starts mid-line
+        lo, hi = self._vis
+        first = self._doc.findBlock(max(0, lo - _LEX_CONTEXT))
+        if first.isValid():
+            base = first.position()
+            first_number = first.blockNumber()
+        else:
+            base = first_number = 0
+        end = text.find('\n', min(len(text), hi + _LEX_CONTEXT))
+        if end < 0:
+            end = len(text)
+        self._busy = True
+        self._job_state = (lang, len(text), (base, end), first_number)
+        QThreadPool.globalInstance().start(
+            _LexJob(lang.lexer, text[base:end], base, self._generation, self._lex_signals)
+        )
+
+    def _on_lex_ready(self, generation: int, tokens: list, starts: list, ranges: list):
+        self._busy = False
+        if generation != self._generation:
+            # document, language or window changed meanwhile; lex again unless a timer is pending
+            if not self._refresh_pending():
+                self._run_refresh()
+            return
+        lang, text_len, window, first_number = self._job_state
+        self._apply_tokens(lang, text_len, window, first_number, tokens, starts, ranges)
+
+    def _apply_tokens(self, lang, text_len: int, window: tuple[int, int], first_number: int,
+                      tokens: list, starts: list, ranges: list):
+        old_tokens = self._tokens
+        old_window = self._window
+        self._window = window
+        self._range_base = first_number
+        delta = text_len - self._text_len
+        edit_span = self._edit_span
+        self._text_len = text_len
+        self._edit_span = None
+        self._tokens = tokens
+        style = getattr(lang, 'style', {}) or {}
+        if style is not self._style:
+            self._style = style
+            self._formats = _build_formats(style)
+        self._starts = starts
+        self._ranges = ranges
+        if lang is not self._applied_language or not old_tokens:
+            # new language/style (or nothing highlighted yet): every block changes
+            self._applied_language = lang
             self.rehighlight()
-        finally:
-            self._busy = False
+            return
+        if old_window is None or old_window[0] != window[0]:
+            # the lexed region moved: re-format its blocks; blocks that fell out of it
+            # keep the formats they already have
+            spans = [window]
+        else:
+            # Only blocks touched by an edit (highlighted with stale tokens at edit time)
+            # or whose tokens differ from the previous pass need new formats.
+            spans = _changed_spans(old_tokens, tokens, delta)
+        if edit_span is not None:
+            spans.append(edit_span)
+        spans.sort()
+        merged: list[list[int]] = []
+        for lo, hi in spans:
+            if merged and lo <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], hi)
+            else:
+                merged.append([lo, hi])
+        for lo, hi in merged:
+            self._rehighlight_range(lo, hi)
+
+    def _on_contents_change(self, pos: int, removed: int, added: int):
+        # Track the edited region in current document coordinates. Mirrors the range
+        # QSyntaxHighlighter re-formats on its own (one extra char after removals).
+        end = pos + added + (1 if removed else 0)
+        self._ranges = None
+        # a job started before this edit lexed the old text; drop its result
+        self._generation += 1
+        if self._edit_span is None:
+            self._edit_span = (pos, end)
+            return
+        lo, hi = self._edit_span
+        if hi >= pos + removed:
+            hi += added - removed
+        elif hi > pos:
+            hi = end
+        self._edit_span = (min(lo, pos), max(hi, end))
+
+    def _rehighlight_range(self, lo: int, hi: int):
+        doc = self.document()
+        block = doc.findBlock(max(0, lo))
+        last = doc.findBlock(min(hi, doc.characterCount() - 1))
+        if not last.isValid():
+            last = doc.lastBlock()
+        last_number = last.blockNumber()
+        while block.isValid() and block.blockNumber() <= last_number:
+            self.rehighlightBlock(block)
+            block = block.next()
 
     def highlightBlock(self, text):  # type: ignore[override]
         if not self._tokens:
             return
-        block_start = self.currentBlock().position()
-        block_end = block_start + len(text)
-        import bisect
-        idx = bisect.bisect_left(self._starts, block_start) - 1
-        if idx < 0:
-            idx = 0
-        n = len(self._tokens)
+        # one native round trip each for the block and its position; the loop below
+        # works on plain ints
+        block = self.currentBlock()
+        block_start = block.position()
+        text_len = len(text)
+        block_end = block_start + text_len
+        ranges = self._ranges
+        if ranges is not None:
+            number = block.blockNumber() - self._range_base
+            if number < 0 or number >= len(ranges):
+                return
+            idx, n = ranges[number]
+        else:
+            # last token starting at or before the block; earlier ones end before it
+            idx = bisect.bisect_right(self._starts, block_start) - 1
+            if idx < 0:
+                idx = 0
+            n = len(self._tokens)
+        tokens = self._tokens
+        get_format = self._formats.get
+        set_format = self.setFormat
         while idx < n:
-            kind, _value, start, end = self._tokens[idx]
+            kind, _value, start, end = tokens[idx]
             if start >= block_end:
                 break
             if end > block_start:
-                color = None
-                if isinstance(self._style, dict):
-                    color = self._style.get(kind, {}).get('color')
-                if color:
-                    fmt = QTextCharFormat()
-                    fmt.setForeground(QColor(color))
-                    s = max(start - block_start, 0)
-                    e = min(end - block_start, len(text))
+                fmt = get_format(kind)
+                if fmt is not None:
+                    s = start - block_start
+                    if s < 0:
+                        s = 0
+                    e = end - block_start
+                    if e > text_len:
+                        e = text_len
                     if e > s:
-                        self.setFormat(s, e - s, fmt)
+                        set_format(s, e - s, fmt)
             idx += 1
@@ -1,4 +1,5 @@
 from __future__ import annotations
+import sys
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, Optional
@@ -23,7 +24,10 @@ Icons are resolved in this order:
 Otherwise returns an empty QIcon() allowing caller stylesheet / fallback.
 """
 
-@dataclass(frozen=True)
+# Shared "no icon" result; QFileSystemModel asks for every visible row
+_EMPTY_ICON = QIcon()
+
+@dataclass(frozen=True, slots=True)
 class IconEntry:
     key: str
     path: str
@@ -33,9 +37,12 @@ class FileIconRegistry:
         self._by_extension: Dict[str, IconEntry] = {}
         self._by_filename: Dict[str, IconEntry] = {}
         self._default_file: Optional[IconEntry] = None
+        # icon path -> loaded icon; tree views ask for the same few icons on every repaint
+        self._icon_cache: Dict[str, QIcon] = {}
 
     def register_extension(self, ext: str, icon_path: str):
-        ext = ext.lower().lstrip('.')
+        # interned: registry keys are long-lived and shared with IconEntry.key
+        ext = sys.intern(ext.lower().lstrip('.'))
         self._by_extension[ext] = IconEntry(ext, icon_path)
 
     def register_filename(self, filename: str, icon_path: str):
@@ -45,22 +52,31 @@ class FileIconRegistry:
         self._default_file = IconEntry('__default__', icon_path)
 
     def icon_for(self, file_path: Path) -> QIcon:
-        name = file_path.name.lower()
+        return self.icon_for_name(file_path.name)
+
+    def icon_for_name(self, name: str) -> QIcon:
+        """Resolve by bare file name (no path parsing; lower-cased once)."""
+        name = name.lower()
         # 1. Exact filename
-        if name in self._by_filename:
-            return self._icon(self._by_filename[name].path)
-        # 2. Extension
-        ext = file_path.suffix.lower().lstrip('.')
-        if ext in self._by_extension:
-            return self._icon(self._by_extension[ext].path)
+        entry = self._by_filename.get(name)
+        if entry is not None:
+            return self._icon(entry.path)
+        # 2. Extension (same rules as Path.suffix: a leading dot is not a separator)
+        dot = name.rfind('.')
+        if dot > 0:
+            entry = self._by_extension.get(name[dot + 1:])
+            if entry is not None:
+                return self._icon(entry.path)
         # 3. Default
         if self._default_file:
             return self._icon(self._default_file.path)
-        return QIcon()
+        return _EMPTY_ICON
 
-    @staticmethod
-    def _icon(rel_path: str) -> QIcon:
-        return QIcon(str(Path(rel_path)))
+    def _icon(self, rel_path: str) -> QIcon:
+        icon = self._icon_cache.get(rel_path)
+        if icon is None:
+            icon = self._icon_cache[rel_path] = QIcon(rel_path)
+        return icon
 
 # Shared singleton registry
 file_icon_registry = FileIconRegistry()
@@ -77,6 +93,6 @@ class FileIconProvider(QFileIconProvider):
         from PySide6.QtCore import QFileInfo
         if isinstance(file_info, QFileInfo):
             if file_info.isDir():
-                return QIcon()  # keep folders icon-less (only chevrons)
-            return self._registry.icon_for(Path(file_info.filePath()))
-        return QIcon()
+                return _EMPTY_ICON  # keep folders icon-less (only chevrons)
+            return self._registry.icon_for_name(file_info.fileName())
+        return _EMPTY_ICON
@@ -1,16 +1,16 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
 from PySide6.QtWidgets import QWidget, QHBoxLayout, QLabel, QSizePolicy, QComboBox
-from PySide6.QtCore import Qt, QSize
+from PySide6.QtCore import Qt, QSize, QTimer
 
-try:
-    from novic.syntax import load_all_languages
-    _LANG_REG = load_all_languages()
-except Exception:  # pragma: no cover
-    _LANG_REG = None
+if TYPE_CHECKING:
+    from .code_editor import CodeEditor
 
 
 class StatusFooter(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._editor: CodeEditor | None = None
         self.setFixedHeight(18)
         self.setStyleSheet("background:#2b2d30; border-top:1px solid #3a3d41;")
         # Ensure footer stretches full width
@@ -30,11 +30,26 @@ class StatusFooter(QWidget):
         self.syntax_combo.setFixedHeight(16)
         self.syntax_combo.setStyleSheet("QComboBox { background:#33363a; color:#c7ccd1; font-size:10px; border:1px solid #3f4246; padding:0 4px;} QComboBox::drop-down{width:14px;}")
         self.syntax_combo.addItem("Plain Text")
-        if _LANG_REG:
-            for lang in sorted(_LANG_REG.languages(), key=lambda l: l.name.lower()):
-                self.syntax_combo.addItem(lang.name)
+        self._languages_loaded = False
         self.syntax_combo.currentTextChanged.connect(self._on_language_changed)
         layout.addWidget(self.syntax_combo)
+        # language list needs the syntax registry; fill it after startup
+        QTimer.singleShot(0, self._ensure_languages)
+
+    def _ensure_languages(self):
+        if self._languages_loaded:
+            return
+        self._languages_loaded = True
+        try:
+            from novic.syntax import get_registry
+            reg = get_registry()
+        except Exception:  # pragma: no cover
+            return
+        combo = self.syntax_combo
+        was = combo.blockSignals(True)
+        for lang in sorted(reg.languages(), key=lambda l: l.name.lower()):
+            combo.addItem(lang.name)
+        combo.blockSignals(was)
 
     def set_status(self, text: str):
         self.label.setText(text)
@@ -48,29 +63,26 @@ class StatusFooter(QWidget):
         return QSize(0, 18)
 
     # External hookup for editor instance
-    def attach_editor(self, editor):
+    def attach_editor(self, editor: CodeEditor):
         self._editor = editor
+        self._ensure_languages()
         # sync combo to editor's active language if available
-        try:
-            lang = getattr(getattr(editor, '_active_language', None), 'name', None)
-            if lang and self.syntax_combo.findText(lang) >= 0:
-                was = self.syntax_combo.blockSignals(True)
-                self.syntax_combo.setCurrentText(lang)
-                self.syntax_combo.blockSignals(was)
-            elif not lang:
-                was = self.syntax_combo.blockSignals(True)
-                self.syntax_combo.setCurrentIndex(0)
-                self.syntax_combo.blockSignals(was)
-        except Exception:
-            pass
+        active = editor.activeLanguage()
+        lang = active.name if active is not None else None
+        combo = self.syntax_combo
+        if lang and combo.findText(lang) >= 0:
+            was = combo.blockSignals(True)
+            combo.setCurrentText(lang)
+            combo.blockSignals(was)
+        elif not lang:
+            was = combo.blockSignals(True)
+            combo.setCurrentIndex(0)
+            combo.blockSignals(was)
 
     def _on_language_changed(self, name: str):
-        if not hasattr(self, '_editor') or name == 'Plain Text':
+        if self._editor is None or name == 'Plain Text':
             return
-        # try to apply by name
-        apply_method = getattr(self._editor, 'applySyntaxByName', None)
-        if callable(apply_method):
-            apply_method(name)
+        self._editor.applySyntaxByName(name)
 
 
 __all__ = ["StatusFooter"]
@@ -1,8 +1,30 @@
-from PySide6.QtWidgets import QMainWindow, QWidget, QVBoxLayout
-from PySide6.QtCore import Qt, QRect, QPoint
+from PySide6.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QRubberBand
+from PySide6.QtCore import Qt, QRect, QPoint, QElapsedTimer, QTimer
 from novic.core.title_bar import TitleBar
 from novic.core.menu_framework import MenuRegistry
 
+# Minimum time between applied resize steps while dragging an edge (~60 Hz)
+_RESIZE_INTERVAL_MS = 16
+# Edge name by hit mask (bit 0 left, 1 right, 2 top, 3 bottom). Corners win over
+# sides and left/top win when the window is narrower than two margins.
+_EDGE_TABLE = (
+    None, 'left', 'right', 'left',
+    'top', 'top-left', 'top-right', 'top-left',
+    'bottom', 'bottom-left', 'bottom-right', 'bottom-left',
+    'top', 'top-left', 'top-right', 'top-left',
+)
+# Resize cursor per grabbed edge
+_EDGE_CURSORS = {
+    'left': Qt.SizeHorCursor,
+    'right': Qt.SizeHorCursor,
+    'top': Qt.SizeVerCursor,
+    'bottom': Qt.SizeVerCursor,
+    'top-left': Qt.SizeFDiagCursor,
+    'bottom-right': Qt.SizeFDiagCursor,
+    'top-right': Qt.SizeBDiagCursor,
+    'bottom-left': Qt.SizeBDiagCursor,
+}
+
 class FramelessWindow(QMainWindow):
     """Reusable frameless window with integrated custom TitleBar and MenuRegistry.
 
@@ -20,6 +42,19 @@ class FramelessWindow(QMainWindow):
         self._resize_margin = 6  # px grab area
         self._resizing = False
         self._resize_edge = None  # type: ignore
+        # drag-resize throttling: moves inside the interval only record the latest position
+        self._resize_throttle = QElapsedTimer()
+        self._pending_resize_pos: QPoint | None = None
+        self._resize_flush = QTimer(self)
+        self._resize_flush.setSingleShot(True)
+        self._resize_flush.timeout.connect(self._flush_resize)
+        # outline resize: drags move a rubber band; the window is resized once on release
+        self._live_resize = False
+        self._rubber: QRubberBand | None = None
+        self._pending_geom: QRect | None = None
+        self._last_cursor = Qt.ArrowCursor  # shape last set on the window
+        self._last_applied_geom: tuple[int, int, int, int] | None = None  # last resize step
+        self._menus_dirty = False  # a menu rebuild is scheduled
 
         # Layout scaffold
         self._central_container = QWidget(self)
@@ -44,15 +79,26 @@ class FramelessWindow(QMainWindow):
 
     # --- menu helpers ---
     def rebuild_menus(self):
+        """Schedule a menu rebuild; repeated calls within one event loop pass (e.g. menu
+        visibility toggled back and forth) collapse into a single rebuild."""
+        if self._menus_dirty:
+            return
+        self._menus_dirty = True
+        QTimer.singleShot(0, self._flush_menus)
+
+    def _flush_menus(self):
+        if not self._menus_dirty:
+            return
+        self._menus_dirty = False
         if not self._show_menu:
             # remove existing if present
-            if getattr(self.title_bar, 'menu_bar', None):
-                try:
-                    self.title_bar.layout().removeWidget(self.title_bar.menu_bar)
-                    self.title_bar.menu_bar.deleteLater()
-                    self.title_bar.menu_bar = None
-                except Exception:
-                    pass
+            mb = getattr(self.title_bar, 'menu_bar', None)
+            if mb is not None:
+                layout = self.title_bar.layout()
+                if layout is not None:
+                    layout.removeWidget(mb)
+                mb.deleteLater()
+                self.title_bar.menu_bar = None
             return
         if hasattr(self.title_bar, 'attach_menus'):
             self.title_bar.attach_menus(self.menu_registry)
@@ -68,11 +114,13 @@ class FramelessWindow(QMainWindow):
             return
         self._resizable = flag
         # propagate to title bar button state
-        if hasattr(self, 'title_bar') and hasattr(self.title_bar, 'set_resizable'):
-            try:
-                self.title_bar.set_resizable(flag)
-            except Exception:
-                pass
+        set_resizable = getattr(getattr(self, 'title_bar', None), 'set_resizable', None)
+        if callable(set_resizable):
+            set_resizable(flag)
+
+    def set_live_resize(self, flag: bool):
+        """Resize the window continuously while dragging instead of showing an outline."""
+        self._live_resize = flag
 
     def set_menu_visible(self, flag: bool):
         if self._show_menu == flag:
@@ -87,8 +135,16 @@ class FramelessWindow(QMainWindow):
             if edge:
                 self._resizing = True
                 self._resize_edge = edge
-                self._drag_origin_geom = self.geometry()
-                self._drag_origin_pos = event.globalPosition().toPoint()
+                # plain ints: _perform_resize reads them on every step
+                g = self.geometry()
+                self._drag_origin_geom = (g.x(), g.y(), g.width(), g.height())
+                gp = event.globalPosition().toPoint()
+                self._drag_origin_pos = (gp.x(), gp.y())
+                self._resize_throttle.invalidate()
+                self._last_applied_geom = None
+                if self._live_resize:
+                    # content repaints once on release instead of per resize step
+                    self._central_container.setUpdatesEnabled(False)
                 # set appropriate resize cursor immediately
                 self._apply_resize_cursor(edge)
                 event.accept()
@@ -97,102 +153,118 @@ class FramelessWindow(QMainWindow):
 
     def mouseMoveEvent(self, event):  # type: ignore
         if self._resizable and not self._resizing:
-            edge = self._detect_edge(event.pos())
-            if edge:
-                cursors = {
-                    'left': Qt.SizeHorCursor,
-                    'right': Qt.SizeHorCursor,
-                    'top': Qt.SizeVerCursor,
-                    'bottom': Qt.SizeVerCursor,
-                    'top-left': Qt.SizeFDiagCursor,
-                    'bottom-right': Qt.SizeFDiagCursor,
-                    'top-right': Qt.SizeBDiagCursor,
-                    'bottom-left': Qt.SizeBDiagCursor,
-                }
-                self.setCursor(cursors.get(edge, Qt.ArrowCursor))
+            m = self._resize_margin
+            p = event.pos()
+            r = self.rect()
+            if m < p.x() < r.width() - m and m < p.y() < r.height() - m:
+                # interior: no edge can match
+                self._set_cursor_shape(Qt.ArrowCursor)
             else:
-                self.setCursor(Qt.ArrowCursor)
+                edge = self._detect_edge(p)
+                self._set_cursor_shape(_EDGE_CURSORS.get(edge, Qt.ArrowCursor))
         if self._resizing:
-            # keep resize cursor while dragging
-            if self._resize_edge:
-                self._apply_resize_cursor(self._resize_edge)
-            self._perform_resize(event.globalPosition().toPoint())
+            pos = event.globalPosition().toPoint()
+            throttle = self._resize_throttle
+            if throttle.isValid() and throttle.elapsed() < _RESIZE_INTERVAL_MS:
+                # too soon after the last step: keep the newest position for the flush
+                self._pending_resize_pos = pos
+                if not self._resize_flush.isActive():
+                    self._resize_flush.start(_RESIZE_INTERVAL_MS - throttle.elapsed())
+                event.accept()
+                return
+            # the resize cursor was set on press and the edge cannot change mid-drag
+            self._pending_resize_pos = None
+            self._perform_resize(pos)
+            throttle.start()
             event.accept()
             return
         super().mouseMoveEvent(event)
 
+    def _flush_resize(self):
+        pos = self._pending_resize_pos
+        self._pending_resize_pos = None
+        if self._resizing and pos is not None:
+            self._perform_resize(pos)
+            self._resize_throttle.start()
+
     def mouseReleaseEvent(self, event):  # type: ignore
         if self._resizing and event.button() == Qt.LeftButton:
+            # apply the last throttled position so the final size matches the pointer
+            self._resize_flush.stop()
+            self._flush_resize()
             self._resizing = False
+            if self._pending_geom is not None:
+                self.setGeometry(self._pending_geom)
+                self._pending_geom = None
+            if self._rubber is not None:
+                self._rubber.hide()
+            if not self._central_container.updatesEnabled():
+                self._central_container.setUpdatesEnabled(True)
+                self._central_container.update()
             self._resize_edge = None
-            self.setCursor(Qt.ArrowCursor)
+            self._set_cursor_shape(Qt.ArrowCursor)
             event.accept()
             return
         super().mouseReleaseEvent(event)
 
     # helper to map edge to cursor and apply
     def _apply_resize_cursor(self, edge: str):
-        mapping = {
-            'left': Qt.SizeHorCursor,
-            'right': Qt.SizeHorCursor,
-            'top': Qt.SizeVerCursor,
-            'bottom': Qt.SizeVerCursor,
-            'top-left': Qt.SizeFDiagCursor,
-            'bottom-right': Qt.SizeFDiagCursor,
-            'top-right': Qt.SizeBDiagCursor,
-            'bottom-left': Qt.SizeBDiagCursor,
-        }
-        self.setCursor(mapping.get(edge, Qt.ArrowCursor))
+        self._set_cursor_shape(_EDGE_CURSORS.get(edge, Qt.ArrowCursor))
+
+    def _set_cursor_shape(self, shape):
+        # setCursor crosses into Qt and re-resolves the cursor; skip when nothing changes
+        if shape != self._last_cursor:
+            self._last_cursor = shape
+            self.setCursor(shape)
 
     # --- internal resize helpers ---
     def _detect_edge(self, pos: QPoint):
         m = self._resize_margin
         r = self.rect()
-        left = pos.x() <= m
-        right = pos.x() >= r.width() - m
-        top = pos.y() <= m
-        bottom = pos.y() >= r.height() - m
-        if top and left:
-            return 'top-left'
-        if top and right:
-            return 'top-right'
-        if bottom and left:
-            return 'bottom-left'
-        if bottom and right:
-            return 'bottom-right'
-        if left:
-            return 'left'
-        if right:
-            return 'right'
-        if top:
-            return 'top'
-        if bottom:
-            return 'bottom'
-        return None
+        x = pos.x()
+        y = pos.y()
+        mask = (x <= m) | ((x >= r.width() - m) << 1) | ((y <= m) << 2) | ((y >= r.height() - m) << 3)
+        return _EDGE_TABLE[mask]
 
     def _perform_resize(self, global_pos):
         if not self._resize_edge:
             return
-        geom: QRect = self._drag_origin_geom
-        delta = global_pos - self._drag_origin_pos
+        gx, gy, gw, gh = self._drag_origin_geom
+        ox, oy = self._drag_origin_pos
+        dx = global_pos.x() - ox
+        dy = global_pos.y() - oy
         min_w = 300
         min_h = 200
-        x = geom.x()
-        y = geom.y()
-        w = geom.width()
-        h = geom.height()
-        if 'right' in self._resize_edge:
-            w = max(min_w, geom.width() + delta.x())
-        if 'bottom' in self._resize_edge:
-            h = max(min_h, geom.height() + delta.y())
-        if 'left' in self._resize_edge:
-            new_w = max(min_w, geom.width() - delta.x())
-            x = geom.right() - new_w + 1
-            w = new_w
-        if 'top' in self._resize_edge:
-            new_h = max(min_h, geom.height() - delta.y())
-            y = geom.bottom() - new_h + 1
-            h = new_h
-        self.setGeometry(QRect(x, y, w, h))
+        x = gx
+        y = gy
+        w = gw
+        h = gh
+        edge = self._resize_edge
+        if 'right' in edge:
+            w = max(min_w, gw + dx)
+        if 'bottom' in edge:
+            h = max(min_h, gh + dy)
+        if 'left' in edge:
+            w = max(min_w, gw - dx)
+            x = gx + gw - w  # keep the right edge fixed
+        if 'top' in edge:
+            h = max(min_h, gh - dy)
+            y = gy + gh - h  # keep the bottom edge fixed
+        if (x, y, w, h) == self._last_applied_geom:
+            # pointer jitter (or clamping at the minimum size) produced the same rect
+            return
+        self._last_applied_geom = (x, y, w, h)
+        target = QRect(x, y, w, h)
+        if self._live_resize:
+            self.setGeometry(target)
+            return
+        # Outline only: relayout/repaint of the whole window is deferred to release
+        self._pending_geom = target
+        if self._rubber is None:
+            # top-level band (no parent) so the outline can extend past the window
+            self._rubber = QRubberBand(QRubberBand.Rectangle)
+        self._rubber.setGeometry(target)
+        if not self._rubber.isVisible():
+            self._rubber.show()
 
 __all__ = ["FramelessWindow"]
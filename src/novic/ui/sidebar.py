@@ -1,16 +1,348 @@
 from __future__ import annotations
 from pathlib import Path
-from PySide6.QtCore import Qt, QSize, QDir, Signal, QMimeData, QUrl, QTimer
-from PySide6.QtGui import QIcon, QDrag, QPainter, QColor, QPixmap, QFont, QPen, QFontMetrics, QAction
+from PySide6.QtCore import Qt, QSize, QDir, Signal, QMimeData, QUrl, QTimer, QRect, QModelIndex, QPersistentModelIndex, QItemSelectionModel, QObject, QRunnable, QThreadPool
+from PySide6.QtGui import QIcon, QDrag, QPainter, QColor, QPixmap, QPixmapCache, QBrush, QFont, QPen, QFontMetrics, QAction
 from PySide6.QtWidgets import QStyledItemDelegate, QStyleOptionViewItem
 from PySide6.QtWidgets import QMenu, QInputDialog, QMessageBox
 from PySide6.QtWidgets import (
-    QWidget, QHBoxLayout, QVBoxLayout, QToolButton, QStackedWidget, QLabel,
+    QWidget, QHBoxLayout, QVBoxLayout, QGridLayout, QToolButton, QStackedWidget, QLabel,
     QFileSystemModel, QTreeView, QFileIconProvider, QSizePolicy, QFrame,
-    QPushButton, QFileDialog, QAbstractItemView
+    QPushButton, QFileDialog, QAbstractItemView, QHeaderView
 )
+import errno
 import shutil
 import os
+import stat
+import sys
+
+# Resource directories, resolved once at import
+_RES_DIR = Path(__file__).resolve().parent.parent / "resources" / "icons"
+_ICON_DIR = _RES_DIR / "side_icon"
+# activity bar icon name -> loaded icon (None when neither an .svg nor a .png exists)
+_ICON_CACHE: dict[str, QIcon | None] = {}
+# Files available in _ICON_DIR, listed on first use
+_ICON_FILES: dict[str, str] | None = None
+# QPixmapCache key prefix for finished drag pixmaps (followed by the label)
+_DRAG_PIX_KEY = "novic-sidebar-drag:"
+# os.copy_file_range exists on Linux with Python 3.8+
+_HAS_COPY_FILE_RANGE = sys.platform.startswith('linux') and hasattr(os, 'copy_file_range')
+# Maximum bytes requested per copy_file_range call
+_COPY_CHUNK = 1 << 30
+# Explorer context menu stylesheet
+_CONTEXT_MENU_QSS = (
+    "QMenu {"
+    " background:#2b2e31;"
+    " border:1px solid #3d4145;"
+    " border-radius:8px;"
+    " padding:6px 4px;"
+    " font-size:12px;"
+    " color:#d6d9dd;"
+    "}"
+    "QMenu::separator {"
+    " height:1px;"
+    " background:#404448;"
+    " margin:6px 10px;"
+    "}"
+    "QMenu::item {"
+    " padding:6px 16px;"
+    " border-radius:5px;"
+    "}"
+    "QMenu::item:selected {"
+    " background:#3a4046;"
+    " color:#ffffff;"
+    "}"
+    "QMenu::item:disabled {"
+    " color:#6f7479;"
+    "}"
+)
+# How long a newly created entry may take to show up in the model before its
+# inline edit is abandoned
+_EDIT_WAIT_MS = 2000
+# Interval for resolving the drop target under the cursor while dragging (~60 Hz)
+_HOVER_INTERVAL_MS = 16
+# Explorer tree background (matches #explorer-tree in _SIDEBAR_QSS)
+_TREE_BG = QColor('#242629')
+# Drag label padding and corner radius
+_DRAG_PAD_X = 10
+_DRAG_PAD_Y = 6
+_DRAG_RADIUS = 8
+
+# Stylesheet for the whole sidebar, applied once on ActivitySidebar and addressed by
+# objectName. "#x, #x *" rules stand in for selector-less sheets on a widget (which
+# cascade to every child); rules that must win over them come later at equal specificity.
+_SIDEBAR_QSS = (
+    "#sidebar-nav, #sidebar-nav * { background:#1d1f21; }"
+    "#sidebar-nav QToolButton { background:transparent; border:0; padding:0; margin:0; color:#cfd2d6; }"
+    "#sidebar-nav QToolButton:focus { outline: none; }"
+    "#sidebar-nav QToolButton::menu-indicator { image: none; width:0; height:0; }"
+    "#sidebar-indicator { background:#2680ff; border:none; border-radius:2px; }"
+    "#sidebar-stack, #sidebar-stack * { background:#242629; }"
+    "#explorer-header { background:#242629; border:none; }"
+    "#explorer-title { color:#cfd2d6; font-weight:bold; font-size:11px; }"
+    "#explorer-fs-status { color:#9ca2a8; font-size:10px; }"
+    "#explorer-empty-title { color:#cfd2d6; font-size:13px; font-weight:bold; }"
+    "#explorer-empty-hint { color:#9ca2a8; font-size:11px; }"
+    "#explorer-open-btn { background:#2f3235; border:1px solid #3a3d41; color:#e3e5e8; padding:6px 14px; border-radius:4px; }"
+    "#explorer-open-btn:hover { background:#3a3d41; }"
+    "#explorer-open-btn:pressed { background:#45484c; }"
+    "#settings-placeholder { color:#cfd2d6; font-size:12px; }"
+    "#explorer-tree { background:#242629; color:#e3e5e8; border:none; outline:0; padding:0; font-size:13px; }"
+    "#explorer-tree::viewport { margin:0; }"
+    "#explorer-tree::item { padding:1px 4px; border:0; }"
+    "#explorer-tree::item:hover { background:#33373b; }"
+    "#explorer-tree::item:selected { background:#3a3f45; }"
+    "#explorer-tree::branch { background: transparent; margin-left:0px; }"
+    "#explorer-tree::branch:has-children:!has-siblings:closed,#explorer-tree::branch:closed:has-children"
+    f" {{ image: url({(_RES_DIR / 'chevron_right.svg').as_posix()}); }}"
+    "#explorer-tree::branch:open:has-children:!has-siblings,#explorer-tree::branch:open:has-children"
+    f" {{ image: url({(_RES_DIR / 'chevron_down.svg').as_posix()}); }}"
+)
+
+
+def _copy_file_range(src: str, dst: str):
+    # Linux: in-kernel copy that reflinks on filesystems supporting it (Btrfs, XFS)
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        infd = fsrc.fileno()
+        outfd = fdst.fileno()
+        size = os.fstat(infd).st_size
+        copied = 0
+        while True:
+            n = os.copy_file_range(infd, outfd, _COPY_CHUNK)
+            if n == 0:
+                if copied == 0 and size > 0:
+                    # some filesystems (procfs, FUSE, cross-fs on older kernels) report 0
+                    # without copying anything; let shutil do the copy instead
+                    raise OSError(errno.EOPNOTSUPP, "copy_file_range copied nothing", src)
+                return
+            copied += n
+
+
+def _fast_copyfile(src: str, dst: str):
+    """Copy file contents without a Python read/write loop.
+
+    Linux uses copy_file_range (falling back to shutil's sendfile path when the
+    filesystem pair does not support it); macOS goes through shutil's fcopyfile; on
+    Windows the OS CopyFileW does the copy in kernel space.
+    """
+    if os.name == 'nt':
+        try:
+            import ctypes
+            if ctypes.windll.kernel32.CopyFileW(str(src), str(dst), False):
+                return
+        except Exception:
+            pass
+    elif _HAS_COPY_FILE_RANGE:
+        try:
+            _copy_file_range(src, dst)
+            return
+        except OSError as e:
+            # unsupported here (old kernel, cross-filesystem, special file): use shutil
+            if e.errno not in (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EPERM):
+                raise
+    shutil.copyfile(src, dst)
+
+
+def _copy_file(src: str, dst: str):
+    # shutil.copy2 equivalent (contents + metadata) on top of _fast_copyfile
+    if os.path.isdir(dst):
+        dst = os.path.join(dst, os.path.basename(src))
+    _fast_copyfile(src, dst)
+    shutil.copystat(src, dst)
+    return dst
+
+
+def _copy_tree(src: str, dst: str):
+    shutil.copytree(src, dst, copy_function=_copy_file)
+
+
+def _dir_names(path: str) -> set[str]:
+    # normcase'd entry names of a directory from a single listing
+    try:
+        with os.scandir(path) as it:
+            return {os.path.normcase(e.name) for e in it}
+    except OSError:
+        return set()
+
+
+def _unique_name(existing: set[str], stem: str, ext: str = "", sep: str = " ") -> str:
+    """First of ``stem+ext``, ``stem{sep}1{ext}``, ... not in ``existing`` (normcase'd names)."""
+    candidate = stem + ext
+    i = 1
+    while os.path.normcase(candidate) in existing:
+        candidate = f"{stem}{sep}{i}{ext}"
+        i += 1
+    return candidate
+
+
+def _count_text(verb: str, n: int) -> str:
+    return f"{verb} {n} item{'s' if n != 1 else ''}…"
+
+
+def _perform_drops(sources: list[str], target_dir: str, root_abs: str) -> list[str]:
+    """Move (inside ``root_abs``) or copy (from outside) each source into ``target_dir``.
+
+    Returns the destination paths that were created. Runs on a pool thread.
+    """
+    changed: list[str] = []
+    normcase = os.path.normcase
+    # trailing separator so "/a/bc" does not count as inside "/a/b"
+    root_prefix = os.path.join(normcase(root_abs), '')
+    target_prefix = os.path.join(normcase(target_dir), '')
+    # Shortest paths first; a source inside an already moved/copied folder travels with
+    # it, while the children of a skipped folder are still dropped on their own
+    roots: list[str] = []
+    for src_abs in sorted({os.path.abspath(src) for src in sources}, key=len):
+        src_norm = normcase(src_abs)
+        if any(src_norm.startswith(r) for r in roots):
+            continue
+        try:
+            is_dir = stat.S_ISDIR(os.stat(src_abs).st_mode)
+        except OSError:
+            continue
+        internal = src_norm.startswith(root_prefix)
+        base_name = os.path.basename(src_abs)
+        dest = os.path.join(target_dir, base_name)
+        # Prevent dropping into itself or descendant
+        if is_dir and target_prefix.startswith(os.path.join(src_norm, '')):
+            continue
+        if internal:
+            if src_norm == normcase(dest) or os.path.lexists(dest):
+                continue
+            try:
+                os.replace(src_abs, dest)
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    continue
+                # different filesystem: copy (through _copy_file) and remove the source
+                try:
+                    shutil.move(src_abs, dest, copy_function=_copy_file)
+                except Exception:
+                    continue
+        else:
+            if os.path.lexists(dest):
+                continue
+            try:
+                if is_dir:
+                    _copy_tree(src_abs, dest)
+                else:
+                    _copy_file(src_abs, dest)
+            except Exception:
+                continue
+        changed.append(dest)
+        roots.append(os.path.join(src_norm, ''))
+    return changed
+
+
+def _delete_paths(paths: list[str]) -> list[str]:
+    """Permanently delete files/folders; returns the parent directories of removed entries."""
+    touched: list[str] = []
+    for p in paths:
+        try:
+            # lstat: a symlink to a folder is removed as a link, not rmtree'd
+            if stat.S_ISDIR(os.lstat(p).st_mode):
+                shutil.rmtree(p)
+            else:
+                os.remove(p)
+            touched.append(os.path.dirname(p))
+        except Exception:
+            pass
+    return touched
+
+
+def _paste_paths(paths: list[str], dest_dir: str, mode: str | None) -> list[str]:
+    """Copy ('copy') or move ('cut') ``paths`` into ``dest_dir``; returns touched dirs."""
+    touched: list[str] = []
+    existing = _dir_names(dest_dir)
+    for src in paths:
+        try:
+            is_dir = stat.S_ISDIR(os.stat(src).st_mode)
+        except OSError:
+            continue
+        base = os.path.basename(src)
+        # auto-rename if exists for copy, skip for cut
+        if os.path.normcase(base) in existing:
+            if mode == 'cut':
+                continue
+            name, ext = os.path.splitext(base)
+            base = _unique_name(existing, name, ext, sep='_')
+        existing.add(os.path.normcase(base))
+        dest = os.path.join(dest_dir, base)
+        try:
+            if mode == 'cut':
+                shutil.move(src, dest)
+                touched.append(os.path.dirname(src))
+                touched.append(dest_dir)
+            elif mode == 'copy':
+                if is_dir:
+                    _copy_tree(src, dest)
+                else:
+                    _copy_file(src, dest)
+                touched.append(dest_dir)
+        except Exception:
+            pass
+    return touched
+
+
+class _FsOpSignals(QObject):
+    # directories whose contents the finished operation changed
+    finished = Signal(list)
+
+
+class _FsOpJob(QRunnable):
+    """Runs one explorer file operation (drop, paste, delete) on a pool thread.
+
+    ``func`` returns the directories it changed.
+    """
+
+    def __init__(self, func, signals: _FsOpSignals):
+        super().__init__()
+        self._func = func
+        self._signals = signals
+
+    def run(self):  # type: ignore[override]
+        try:
+            touched = list(self._func())
+        except Exception:
+            touched = []
+        try:
+            # queued to the GUI thread: the signals object lives there
+            self._signals.finished.emit(touched)
+        except RuntimeError:  # sidebar (and its signals object) destroyed meanwhile
+            pass
+
+
+def _side_icon_files() -> dict[str, str]:
+    # icon name -> file path from a single listing of _ICON_DIR (.svg preferred over .png)
+    global _ICON_FILES
+    if _ICON_FILES is None:
+        files: dict[str, str] = {}
+        try:
+            entries = sorted(os.scandir(_ICON_DIR), key=lambda e: e.name)
+        except OSError:
+            entries = []
+        for entry in entries:
+            stem, ext = os.path.splitext(entry.name)
+            if ext == '.svg' or (ext == '.png' and stem not in files):
+                files[stem] = entry.path
+        _ICON_FILES = files
+    return _ICON_FILES
+
+
+def _side_icon(icon_name: str) -> QIcon | None:
+    if icon_name in _ICON_CACHE:
+        return _ICON_CACHE[icon_name]
+    path = _side_icon_files().get(icon_name)
+    icon = QIcon(path) if path else None
+    _ICON_CACHE[icon_name] = icon
+    return icon
+
+
+class _ContextMenu(QMenu):
+    """Explorer context menu; keeps the pointing-hand cursor while shown."""
+
+    def showEvent(self, e):  # type: ignore
+        super().showEvent(e)
+        self.setCursor(Qt.PointingHandCursor)
 
 
 class _FileTreeView(QTreeView):
@@ -28,7 +360,15 @@ class _FileTreeView(QTreeView):
         self.setAcceptDrops(True)
         self.setDropIndicatorShown(True)
         self.setDragDropMode(QAbstractItemView.DragDrop)
-        self._hover_index = None  # type: ignore
+        # persistent: QFileSystemModel may insert/remove rows while a drag hovers
+        self._hover_index: QPersistentModelIndex | None = None
+        # drag-hover updates are coalesced to one per frame; only the viewport position is
+        # kept until the timer fires, and it is resolved against the model at that point
+        self._pending_hover_pos = None
+        self._hover_timer = QTimer(self)
+        self._hover_timer.setSingleShot(True)
+        self._hover_timer.setInterval(_HOVER_INTERVAL_MS)
+        self._hover_timer.timeout.connect(self._apply_hover)
         self.setContextMenuPolicy(Qt.DefaultContextMenu)
         self.setEditTriggers(
             QAbstractItemView.EditKeyPressed |
@@ -39,16 +379,37 @@ class _FileTreeView(QTreeView):
             def __init__(self, view: '_FileTreeView'):
                 super().__init__(view)
                 self._view = view
-                self._color = QColor('#2f4254')  # subtle highlight
+                self._brush = QBrush(QColor('#2f4254'))  # subtle highlight
 
             def paint(self, painter: QPainter, option: QStyleOptionViewItem, index):  # type: ignore
-                if self._view._hover_index is not None and index == self._view._hover_index:
-                    painter.save()
-                    painter.fillRect(option.rect, self._color)
-                    painter.restore()
+                hover = self._view._hover_index
+                if hover is not None and index == hover:
+                    # fillRect leaves the painter state untouched; no save/restore needed
+                    painter.fillRect(option.rect, self._brush)
                 super().paint(painter, option, index)
 
         self.setItemDelegate(_HoverDelegate(self))
+        # drag label font/metrics, reused across drags (finished pixmaps go to QPixmapCache)
+        self._drag_font = QFont()
+        self._drag_font.setPointSize(9)
+        self._drag_fm = QFontMetrics(self._drag_font)
+        self._drag_bg = self._build_drag_background()
+        # context menu, built on first use (see _context_menu)
+        self._ctx_menu: QMenu | None = None
+        self._ctx_actions: dict[str, QAction] = {}
+        self._ctx_state: dict = {}
+        # The viewport fills its own background (paintEvent), so Qt need not repaint the
+        # styled tree frame and the panels underneath it for every dirty row
+        vp = self.viewport()
+        vp.setAttribute(Qt.WA_OpaquePaintEvent, True)
+        vp.setAttribute(Qt.WA_NoSystemBackground, True)
+        vp.setAutoFillBackground(False)
+
+    def paintEvent(self, event):  # type: ignore[override]
+        painter = QPainter(self.viewport())
+        painter.fillRect(event.rect(), _TREE_BG)
+        painter.end()
+        super().paintEvent(event)
 
     # --- context menu -------------------------------------------------------
     def contextMenuEvent(self, event):  # type: ignore
@@ -64,284 +425,198 @@ class _FileTreeView(QTreeView):
             clicked_path = model.filePath(idx)
             is_dir = model.isDir(idx)
             # ensure selection reflects right-clicked item if not already multi-select including it
-            if idx not in self.selectedIndexes():
-                self.selectionModel().select(idx, self.selectionModel().Clear | self.selectionModel().Select | self.selectionModel().Rows)
-        selected_paths = []
-        for sidx in self.selectedIndexes():
-            if sidx.column() != 0:
-                continue
-            try:
-                p = model.filePath(sidx)
-            except Exception:
-                p = None
-            if p:
-                selected_paths.append(p)
-        # Custom menu subclass to enforce cursor + potential future tweaks
-        class _ContextMenu(QMenu):  # local lightweight subclass
-            def showEvent(self, e):  # type: ignore
-                super().showEvent(e)
-                self.setCursor(Qt.PointingHandCursor)
+            sm = self.selectionModel()
+            if not sm.isSelected(idx):
+                sm.select(idx, QItemSelectionModel.ClearAndSelect | QItemSelectionModel.Rows)
+        # one pass over the selection: name-column indexes and their paths
+        selected_rows = self.selectionModel().selectedRows(0)
+        selected_paths = [p for p in map(model.filePath, selected_rows) if p]
+        self._ctx_state = {
+            'root_path': root_path,
+            'clicked_path': clicked_path,
+            'is_dir': is_dir,
+            'selected_rows': selected_rows,
+            'selected_paths': selected_paths,
+        }
+
+        menu = self._context_menu()
+        acts = self._ctx_actions
+        can_create = is_dir or not clicked_path  # folder or empty area
+        single = len(selected_paths) == 1
+        acts['new_folder'].setVisible(can_create)
+        acts['new_file'].setVisible(can_create)
+        acts['separator'].setVisible(can_create)
+        acts['rename'].setVisible(single)
+        for key in ('delete', 'cut', 'copy', 'copy_path'):
+            acts[key].setVisible(bool(selected_paths))
+        acts['paste'].setVisible(bool(getattr(self._sidebar, '_clipboard_paths', None)))
+        acts['open_explorer'].setVisible(single)
+        if not any(a.isVisible() for a in menu.actions()):
+            return
+        menu.exec(self.viewport().mapToGlobal(pos))
+
+    def _context_menu(self) -> QMenu:
+        # Built (and styled) on the first right-click, then reused; each event only
+        # toggles action visibility and refreshes self._ctx_state
+        if self._ctx_menu is not None:
+            return self._ctx_menu
         menu = _ContextMenu(self)
         menu.setCursor(Qt.PointingHandCursor)
-        menu.setStyleSheet(
-            "QMenu {"
-            " background:#2b2e31;"
-            " border:1px solid #3d4145;"
-            " border-radius:8px;"
-            " padding:6px 4px;"
-            " font-size:12px;"
-            " color:#d6d9dd;"
-            "}"
-            "QMenu::separator {"
-            " height:1px;"
-            " background:#404448;"
-            " margin:6px 10px;"
-            "}"
-            "QMenu::item {"
-            " padding:6px 16px;"
-            " border-radius:5px;"
-            "}"
-            "QMenu::item:selected {"
-            " background:#3a4046;"
-            " color:#ffffff;"
-            "}"
-            "QMenu::item:disabled {"
-            " color:#6f7479;"
-            "}"
-        )
-
-        def _refresh():
-            try:
-                current = model.rootPath()
-                model.setRootPath("")
-                model.setRootPath(current)
-            except Exception:
+        menu.setStyleSheet(_CONTEXT_MENU_QSS)
+        acts: dict[str, QAction] = {}
+        for key, text, slot in (
+            ('new_folder', "New Folder", self._ctx_new_folder),
+            ('new_file', "New File", self._ctx_new_file),
+            ('separator', None, None),
+            ('rename', "Rename", self._ctx_rename),
+            ('delete', "Delete", self._ctx_delete),
+            ('cut', "Cut", self._ctx_cut),
+            ('copy', "Copy", self._ctx_copy),
+            ('paste', "Paste", self._ctx_paste),
+            ('copy_path', "Copy Path", self._ctx_copy_path),
+            ('open_explorer', "Open in Explorer", self._ctx_open_explorer),
+        ):
+            if text is None:
+                acts[key] = menu.addSeparator()
+                continue
+            act = QAction(text, menu)
+            act.triggered.connect(slot)
+            menu.addAction(act)
+            acts[key] = act
+        self._ctx_menu = menu
+        self._ctx_actions = acts
+        return menu
+
+    # --- context menu actions (read the state captured by contextMenuEvent) --
+    def _ctx_target_directory(self) -> str:
+        # Directory where new file/folder or paste should land
+        st = self._ctx_state
+        clicked_path = st['clicked_path']
+        if clicked_path and st['is_dir']:
+            return clicked_path
+        if clicked_path:
+            return os.path.dirname(clicked_path)
+        return st['root_path']
+
+    def _ctx_create(self, base_name: str, make):
+        model = self.model()
+        base_dir = self._ctx_target_directory()
+        path = os.path.join(base_dir, _unique_name(_dir_names(base_dir), base_name))
+        try:
+            make(path)
+        except Exception:
+            return
+        # ensure parent expanded then edit the new entry's name inline
+        parent_idx = model.index(base_dir)
+        if parent_idx.isValid():
+            self.expand(parent_idx)
+        self._edit_when_ready(path)
+
+    def _edit_when_ready(self, path: str):
+        """Start inline editing of ``path`` as soon as the model has a row for it."""
+        model = self.model()
+        idx = model.index(path)
+        if idx.isValid():
+            self.setCurrentIndex(idx)
+            self.edit(idx)
+            return
+        parent_idx = model.index(os.path.dirname(path))
+        listening = True
+
+        def _on_rows_inserted(parent, first, last):
+            if parent != parent_idx:
+                return
+            idx_new = model.index(path)
+            if not idx_new.isValid():
+                return
+            _stop()
+            self.setCurrentIndex(idx_new)
+            self.edit(idx_new)
+
+        def _stop():
+            # called on success and again by the timeout; disconnect only once (PySide
+            # warns on disconnecting a slot that is no longer connected)
+            nonlocal listening
+            if listening:
+                listening = False
+                model.rowsInserted.disconnect(_on_rows_inserted)
+
+        model.rowsInserted.connect(_on_rows_inserted)
+        # the entry may never appear (e.g. removed right away); don't listen forever
+        QTimer.singleShot(_EDIT_WAIT_MS, _stop)
+
+    def _ctx_new_folder(self):
+        self._ctx_create("New Folder", os.makedirs)
+
+    def _ctx_new_file(self):
+        def _make(path):
+            with open(path, 'w', encoding='utf-8'):
                 pass
+        self._ctx_create("New File", _make)
 
-        # Helpers
-        def _target_directory():
-            # Directory where new file/folder or paste should land
-            if clicked_path and is_dir:
-                return clicked_path
-            if clicked_path and not is_dir:
-                return os.path.dirname(clicked_path)
-            return root_path
-
-        # New Folder
-        if is_dir or not clicked_path:  # allow when right-clicking folder or empty area
-            act_new_folder = QAction("New Folder", menu)
-            def _new_folder():
-                base_dir = _target_directory()
-                base_name = "New Folder"
-                candidate = base_name
-                i = 1
-                while os.path.exists(os.path.join(base_dir, candidate)):
-                    candidate = f"{base_name} {i}"
-                    i += 1
-                path = os.path.join(base_dir, candidate)
-                try:
-                    os.makedirs(path)
-                except Exception:
-                    return
-                # ensure parent expanded then edit the new folder name inline
-                parent_idx = model.index(base_dir)
-                if parent_idx.isValid():
-                    self.expand(parent_idx)
-                def _try_edit(attempt=0):
-                    idx_new = model.index(path)
-                    if idx_new.isValid():
-                        self.setCurrentIndex(idx_new)
-                        self.edit(idx_new)
-                    elif attempt < 10:
-                        QTimer.singleShot(50, lambda: _try_edit(attempt+1))
-                QTimer.singleShot(0, _try_edit)
-            act_new_folder.triggered.connect(_new_folder)
-            menu.addAction(act_new_folder)
-
-        # New File
-        if is_dir or not clicked_path:
-            act_new_file = QAction("New File", menu)
-            def _new_file():
-                base_dir = _target_directory()
-                base_name = "New File"
-                candidate = base_name
-                i = 1
-                while os.path.exists(os.path.join(base_dir, candidate)):
-                    candidate = f"{base_name} {i}"
-                    i += 1
-                path = os.path.join(base_dir, candidate)
-                try:
-                    with open(path, 'w', encoding='utf-8'):
-                        pass
-                except Exception:
-                    return
-                parent_idx = model.index(base_dir)
-                if parent_idx.isValid():
-                    self.expand(parent_idx)
-                def _try_edit(attempt=0):
-                    idx_new = model.index(path)
-                    if idx_new.isValid():
-                        self.setCurrentIndex(idx_new)
-                        self.edit(idx_new)
-                    elif attempt < 10:
-                        QTimer.singleShot(50, lambda: _try_edit(attempt+1))
-                QTimer.singleShot(0, _try_edit)
-            act_new_file.triggered.connect(_new_file)
-            menu.addAction(act_new_file)
-
-        if menu.actions():
-            menu.addSeparator()
-
-        # Rename
-        if len(selected_paths) == 1:
-            act_rename = QAction("Rename", menu)
-            def _rename():
-                target_idx = None
-                for sidx in self.selectedIndexes():
-                    if sidx.column() == 0:
-                        target_idx = sidx
-                        break
-                if not target_idx:
-                    return
-                def _attempt(attempt=0):
-                    self.setCurrentIndex(target_idx)
-                    started = self.edit(target_idx)
-                    if (not started) and attempt < 8:
-                        QTimer.singleShot(40, lambda: _attempt(attempt+1))
-                QTimer.singleShot(0, _attempt)
-            act_rename.triggered.connect(_rename)
-            menu.addAction(act_rename)
-
-        # Delete
-        if selected_paths:
-            act_delete = QAction("Delete", menu)
-            def _delete():
-                if QMessageBox.question(self, "Delete", f"Delete {len(selected_paths)} item(s)?", QMessageBox.Yes | QMessageBox.No, QMessageBox.No) != QMessageBox.Yes:
-                    return
-                for p in selected_paths:
-                    try:
-                        if os.path.isdir(p):
-                            shutil.rmtree(p)
-                        else:
-                            os.remove(p)
-                    except Exception:
-                        pass
-                _refresh()
-            act_delete.triggered.connect(_delete)
-            menu.addAction(act_delete)
-
-        # Cut / Copy
-        if selected_paths:
-            act_cut = QAction("Cut", menu)
-            act_copy = QAction("Copy", menu)
-            def _cut():
-                self._sidebar._clipboard_paths = selected_paths[:]  # type: ignore[attr-defined]
-                self._sidebar._clipboard_mode = 'cut'  # type: ignore[attr-defined]
-            def _copy():
-                self._sidebar._clipboard_paths = selected_paths[:]  # type: ignore[attr-defined]
-                self._sidebar._clipboard_mode = 'copy'  # type: ignore[attr-defined]
-            act_cut.triggered.connect(_cut)
-            act_copy.triggered.connect(_copy)
-            menu.addAction(act_cut)
-            menu.addAction(act_copy)
-
-        # Paste
-        if getattr(self._sidebar, '_clipboard_paths', None):
-            act_paste = QAction("Paste", menu)
-            def _paste():
-                dest_dir = _target_directory()
-                paths = getattr(self._sidebar, '_clipboard_paths', [])
-                mode = getattr(self._sidebar, '_clipboard_mode', None)
-                any_changed = False
-                for src in paths:
-                    if not os.path.exists(src):
-                        continue
-                    base = os.path.basename(src)
-                    dest = os.path.join(dest_dir, base)
-                    # auto-rename if exists for copy, skip for cut
-                    if os.path.exists(dest):
-                        if mode == 'cut':
-                            continue
-                        i = 1
-                        name, ext = os.path.splitext(base)
-                        while True:
-                            candidate = f"{name}_{i}{ext}"
-                            cpath = os.path.join(dest_dir, candidate)
-                            if not os.path.exists(cpath):
-                                dest = cpath
-                                break
-                            i += 1
-                    try:
-                        if mode == 'cut':
-                            shutil.move(src, dest)
-                            any_changed = True
-                        elif mode == 'copy':
-                            if os.path.isdir(src):
-                                shutil.copytree(src, dest)
-                            else:
-                                shutil.copy2(src, dest)
-                            any_changed = True
-                    except Exception:
-                        pass
-                if mode == 'cut':
-                    # Clear clipboard after move
-                    self._sidebar._clipboard_paths = []  # type: ignore[attr-defined]
-                    self._sidebar._clipboard_mode = None  # type: ignore[attr-defined]
-                if any_changed:
-                    _refresh()
-            act_paste.triggered.connect(_paste)
-            menu.addAction(act_paste)
-
-        # Copy Path
-        if selected_paths:
-            act_copy_path = QAction("Copy Path", menu)
-            def _copy_path():
-                try:
-                    from PySide6.QtGui import QGuiApplication
-                    clip = QGuiApplication.clipboard()
-                    clip.setText('\n'.join(selected_paths))
-                except Exception:
-                    pass
-            act_copy_path.triggered.connect(_copy_path)
-            menu.addAction(act_copy_path)
-
-        # Open in Explorer
-        if len(selected_paths) == 1:
-            act_open_explorer = QAction("Open in Explorer", menu)
-            def _open_explorer():
-                target = selected_paths[0]
-                try:
-                    if os.path.isdir(target):
-                        os.startfile(target)  # type: ignore[attr-defined]
-                    else:
-                        os.startfile(os.path.dirname(target))  # type: ignore[attr-defined]
-                except Exception:
-                    pass
-            act_open_explorer.triggered.connect(_open_explorer)
-            menu.addAction(act_open_explorer)
-
-        if not menu.actions():
+    def _ctx_rename(self):
+        rows = self._ctx_state['selected_rows']
+        target_idx = rows[0] if rows else None
+        if target_idx is None or not target_idx.isValid():
             return
-        menu.exec(self.viewport().mapToGlobal(pos))
+        def _attempt(attempt=0):
+            self.setCurrentIndex(target_idx)
+            started = self.edit(target_idx)
+            if (not started) and attempt < 8:
+                QTimer.singleShot(40, lambda: _attempt(attempt+1))
+        QTimer.singleShot(0, _attempt)
+
+    def _ctx_delete(self):
+        selected_paths = self._ctx_state['selected_paths']
+        if QMessageBox.question(self, "Delete", f"Permanently delete {len(selected_paths)} item(s)? This cannot be undone.", QMessageBox.Yes | QMessageBox.No, QMessageBox.No) != QMessageBox.Yes:
+            return
+        paths = selected_paths[:]
+        self._sidebar._queue_fs_op(_count_text("Deleting", len(paths)), lambda: _delete_paths(paths))
+
+    def _ctx_cut(self):
+        self._sidebar._clipboard_paths = self._ctx_state['selected_paths'][:]  # type: ignore[attr-defined]
+        self._sidebar._clipboard_mode = 'cut'  # type: ignore[attr-defined]
+
+    def _ctx_copy(self):
+        self._sidebar._clipboard_paths = self._ctx_state['selected_paths'][:]  # type: ignore[attr-defined]
+        self._sidebar._clipboard_mode = 'copy'  # type: ignore[attr-defined]
+
+    def _ctx_paste(self):
+        dest_dir = self._ctx_target_directory()
+        paths = list(getattr(self._sidebar, '_clipboard_paths', []))
+        mode = getattr(self._sidebar, '_clipboard_mode', None)
+        if mode == 'cut':
+            # Clear clipboard after move
+            self._sidebar._clipboard_paths = []  # type: ignore[attr-defined]
+            self._sidebar._clipboard_mode = None  # type: ignore[attr-defined]
+        if paths:
+            self._sidebar._queue_fs_op(_count_text("Pasting", len(paths)), lambda: _paste_paths(paths, dest_dir, mode))
+
+    def _ctx_copy_path(self):
+        try:
+            from PySide6.QtGui import QGuiApplication
+            clip = QGuiApplication.clipboard()
+            clip.setText('\n'.join(self._ctx_state['selected_paths']))
+        except Exception:
+            pass
+
+    def _ctx_open_explorer(self):
+        target = self._ctx_state['selected_paths'][0]
+        try:
+            if os.path.isdir(target):
+                os.startfile(target)  # type: ignore[attr-defined]
+            else:
+                os.startfile(os.path.dirname(target))  # type: ignore[attr-defined]
+        except Exception:
+            pass
 
     # Provide URLs for dragging out to OS / other apps
     def startDrag(self, supportedActions):  # type: ignore
-        idxs = self.selectedIndexes()
-        if not idxs:
+        rows = self.selectionModel().selectedRows(0)
+        if not rows:
             return super().startDrag(supportedActions)
-        paths = []
-        primary_indexes = []  # only column 0 indexes used for icon composition
         model = self.model()
-        for idx in idxs:
-            if idx.column() != 0:
-                continue
-            try:
-                p = model.filePath(idx)  # type: ignore[attr-defined]
-            except Exception:
-                p = None
-            if p:
-                paths.append(p)
-                primary_indexes.append(idx)
+        paths = [p for p in map(model.filePath, rows) if p]  # type: ignore[attr-defined]
         if not paths:
             return super().startDrag(supportedActions)
         mime = QMimeData()
@@ -351,85 +626,130 @@ class _FileTreeView(QTreeView):
 
         # --- Build a drag pixmap so user sees a visual representation ---------
         try:
-            padding_x = 10
-            padding_y = 6
-            radius = 8
-            font = QFont()
-            font.setPointSize(9)
-            fm = QFontMetrics(font)
-            if len(primary_indexes) == 1:
-                label = Path(paths[0]).name
-            else:
-                count = len(primary_indexes)
-                first_name = Path(paths[0]).name
-                label = f"{first_name} (+{count-1} more)" if count > 1 else first_name
-            text_w = fm.horizontalAdvance(label)
-            text_h = fm.height()
-            pix = QPixmap(text_w + padding_x * 2, text_h + padding_y * 2)
-            pix.fill(Qt.transparent)
-            painter = QPainter(pix)
-            painter.setRenderHint(QPainter.Antialiasing, True)
-            # Semi-transparent blue background
-            bg = QColor(38, 128, 255, 150)
-            painter.setPen(Qt.NoPen)
-            painter.setBrush(bg)
-            painter.drawRoundedRect(0, 0, pix.width(), pix.height(), radius, radius)
-            painter.setFont(font)
-            painter.setPen(QColor('#ffffff'))
-            painter.drawText(padding_x, padding_y + fm.ascent(), fm.elidedText(label, Qt.ElideMiddle, text_w))
-            painter.end()
+            count = len(paths)
+            first_name = os.path.basename(paths[0])
+            label = f"{first_name} (+{count-1} more)" if count > 1 else first_name
+            pix = self._drag_pixmap(label)
             drag.setPixmap(pix)
             drag.setHotSpot(pix.rect().topLeft())
         except Exception:
             pass
         drag.exec(Qt.MoveAction | Qt.CopyAction, Qt.MoveAction)
 
+    def _build_drag_background(self) -> tuple[QPixmap, QPixmap, QPixmap]:
+        # Paint the rounded label background once at minimum width and slice it into
+        # left cap / one-pixel middle column / right cap
+        r = _DRAG_RADIUS
+        h = self._drag_fm.height() + _DRAG_PAD_Y * 2
+        base = QPixmap(2 * r + 1, h)
+        base.fill(Qt.transparent)
+        painter = QPainter(base)
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        # Semi-transparent blue background
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(38, 128, 255, 150))
+        painter.drawRoundedRect(0, 0, base.width(), h, r, r)
+        painter.end()
+        return base.copy(0, 0, r, h), base.copy(r, 0, 1, h), base.copy(r + 1, 0, r, h)
+
+    def _drag_pixmap(self, label: str) -> QPixmap:
+        key = _DRAG_PIX_KEY + label
+        pix = QPixmapCache.find(key)
+        if pix is not None:
+            return pix
+        left, mid, right = self._drag_bg
+        fm = self._drag_fm
+        text_w = fm.horizontalAdvance(label)
+        w = text_w + _DRAG_PAD_X * 2
+        h = left.height()
+        pix = QPixmap(w, h)
+        pix.fill(Qt.transparent)
+        painter = QPainter(pix)
+        # pre-rendered rounded caps with a stretched middle column in between
+        painter.drawPixmap(0, 0, left)
+        painter.drawPixmap(QRect(left.width(), 0, w - left.width() - right.width(), h), mid)
+        painter.drawPixmap(w - right.width(), 0, right)
+        painter.setFont(self._drag_font)
+        painter.setPen(QColor('#ffffff'))
+        painter.drawText(_DRAG_PAD_X, _DRAG_PAD_Y + fm.ascent(), label)
+        painter.end()
+        QPixmapCache.insert(key, pix)
+        return pix
+
     # Accept external drags
+    # Only URL drags (and our own) are accepted; anything else is ignored here without
+    # running QAbstractItemView's model-based drop checks
     def dragEnterEvent(self, event):  # type: ignore
-        if event.mimeData().hasUrls() or event.source() is self:
-            event.acceptProposedAction()
-        else:
-            super().dragEnterEvent(event)
+        if not (event.mimeData().hasUrls() or event.source() is self):
+            event.ignore()
+            return
+        event.acceptProposedAction()
 
     def dragMoveEvent(self, event):  # type: ignore
-        if event.mimeData().hasUrls() or event.source() is self:
-            pos = event.position().toPoint()
-            idx = self.indexAt(pos)
-            model = None
+        if not (event.mimeData().hasUrls() or event.source() is self):
+            # clear hover if leaving acceptable region
+            self._clear_hover()
+            event.ignore()
+            return
+        # hover target is resolved at most once per frame (_apply_hover)
+        self._pending_hover_pos = event.position().toPoint()
+        if not self._hover_timer.isActive():
+            self._hover_timer.start()
+        event.acceptProposedAction()
+
+    def _apply_hover(self):
+        pos = self._pending_hover_pos
+        self._pending_hover_pos = None
+        hover = self._hover_index
+        if hover is not None and not hover.isValid():
+            # its row was removed while this update was pending; nothing left to repaint
+            self._hover_index = None
+        if pos is None:
+            return
+        idx = self.indexAt(pos)
+        model = None
+        try:
+            model = self.model()
+        except Exception:
+            pass
+        target_idx = None
+        if idx.isValid() and model is not None:
             try:
-                model = self.model()
+                if model.isDir(idx):  # type: ignore[attr-defined]
+                    target_idx = idx
+                else:
+                    # use parent folder for files
+                    p = idx.parent()
+                    if p.isValid():
+                        target_idx = p
             except Exception:
                 pass
-            target_idx = None
-            if idx.isValid() and model is not None:
-                try:
-                    if model.isDir(idx):  # type: ignore[attr-defined]
-                        target_idx = idx
-                    else:
-                        # use parent folder for files
-                        p = idx.parent()
-                        if p.isValid():
-                            target_idx = p
-                except Exception:
-                    pass
-            # Only update/repaint if changed
-            if target_idx != getattr(self, '_hover_index', None):
-                self._hover_index = target_idx  # type: ignore
-                self.viewport().update()
-            event.acceptProposedAction()
-        else:
-            # clear hover if leaving acceptable region
-            if self._hover_index is not None:
-                self._hover_index = None
-                self.viewport().update()
-            super().dragMoveEvent(event)
+        self._set_hover_index(target_idx)
+
+    def _clear_hover(self):
+        self._hover_timer.stop()
+        self._pending_hover_pos = None
+        self._set_hover_index(None)
 
     def dragLeaveEvent(self, event):  # type: ignore
-        if self._hover_index is not None:
-            self._hover_index = None
-            self.viewport().update()
+        self._clear_hover()
         super().dragLeaveEvent(event)
 
+    def _set_hover_index(self, idx):
+        prev = self._hover_index
+        if idx is None:
+            if prev is None:
+                return
+        elif prev is not None and prev == idx:
+            return
+        self._hover_index = None if idx is None else QPersistentModelIndex(idx)
+        # repaint only the rows losing/gaining the highlight
+        vp = self.viewport()
+        if prev is not None and prev.isValid():
+            vp.update(self.visualRect(prev))
+        if idx is not None:
+            vp.update(self.visualRect(idx))
+
     def dropEvent(self, event):  # type: ignore
         model: QFileSystemModel = self.model()  # type: ignore[assignment]
         sidebar = self._sidebar
@@ -447,64 +767,17 @@ class _FileTreeView(QTreeView):
         if not target_dir:
             target_dir = root
         target_dir = os.path.abspath(target_dir)
-        changed = False
-        if event.mimeData().hasUrls():
-            root_abs = os.path.abspath(root)
-            for url in event.mimeData().urls():
-                src = url.toLocalFile()
-                if not src:
-                    continue
-                src_abs = os.path.abspath(src)
-                # Internal if common root path equals project root
-                try:
-                    internal = os.path.commonpath([src_abs, root_abs]) == root_abs
-                except Exception:
-                    internal = False
-                base_name = os.path.basename(src_abs)
-                dest = os.path.join(target_dir, base_name)
-                # Prevent dropping into itself or descendant
-                try:
-                    if os.path.isdir(src_abs) and os.path.commonpath([src_abs, target_dir]) == src_abs:
-                        continue
-                except Exception:
-                    pass
-                if internal:
-                    if os.path.normcase(src_abs) == os.path.normcase(dest) or os.path.exists(dest):
-                        continue
-                    # Attempt atomic rename first
-                    try:
-                        os.rename(src_abs, dest)
-                        changed = True
-                    except Exception:
-                        try:
-                            shutil.move(src_abs, dest)
-                            changed = True
-                        except Exception:
-                            pass
-                else:
-                    if os.path.exists(dest):
-                        continue
-                    try:
-                        if os.path.isdir(src_abs):
-                            shutil.copytree(src_abs, dest)
-                        else:
-                            shutil.copy2(src_abs, dest)
-                        changed = True
-                    except Exception:
-                        pass
-            # Internal drag should be Move action
-            event.setDropAction(Qt.MoveAction)
-        if changed:
-            try:
-                current = model.rootPath()
-                model.setRootPath("")
-                model.setRootPath(current)
-            except Exception:
-                pass
+        md = event.mimeData()
+        if md.hasUrls():
+            # local paths decoded once; non-file URLs are dropped here
+            sources = [u.toLocalFile() for u in md.urls() if u.isLocalFile()]
+            sidebar._queue_drops(sources, target_dir, sidebar._current_root_abs)
+            # The files are moved/copied later on a pool thread. Only our own drags may
+            # report a move: another drag source could delete its originals on
+            # MoveAction while the copy is still running.
+            event.setDropAction(Qt.MoveAction if event.source() is self else Qt.CopyAction)
         # clear hover highlight after drop
-        if self._hover_index is not None:
-            self._hover_index = None
-            self.viewport().update()
+        self._clear_hover()
         event.accept()
 
 
@@ -526,6 +799,8 @@ class ActivitySidebar(QWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        # every child is styled from this one sheet (see _SIDEBAR_QSS)
+        self.setStyleSheet(_SIDEBAR_QSS)
         # Root layout
         root_layout = QHBoxLayout(self)
         root_layout.setContentsMargins(0, 0, 0, 0)
@@ -534,8 +809,11 @@ class ActivitySidebar(QWidget):
         # --- Activity icon bar -------------------------------------------------
         self._nav_bar = QWidget(self)
         self._nav_bar.setFixedWidth(self.ICON_BAR_WIDTH)
-        self._nav_bar.setStyleSheet("background:#1d1f21;")
-        nav_layout = QVBoxLayout(self._nav_bar)
+        # One stylesheet for the bar and its buttons, set before the children exist so
+        # it is parsed once and each button is polished once
+        self._nav_bar.setObjectName("sidebar-nav")
+        # Single grid layout (buttons stacked in column 0, stretch row below them)
+        nav_layout = QGridLayout(self._nav_bar)
         nav_layout.setContentsMargins(0, 6, 0, 6)
         nav_layout.setSpacing(4)
 
@@ -545,13 +823,9 @@ class ActivitySidebar(QWidget):
             btn.setFixedSize(self.ICON_BAR_WIDTH, 44)
             btn.setCursor(Qt.PointingHandCursor)
             btn.setAutoRaise(True)
-            btn.setStyleSheet("QToolButton { background:transparent; border:0; }")
-            icon_path_svg = Path(__file__).resolve().parent.parent / "resources" / "icons" / "side_icon" / f"{icon_name}.svg"
-            icon_path_png = icon_path_svg.with_suffix('.png')
-            if icon_path_svg.exists():
-                btn.setIcon(QIcon(str(icon_path_svg)))
-            elif icon_path_png.exists():
-                btn.setIcon(QIcon(str(icon_path_png)))
+            icon = _side_icon(icon_name)
+            if icon is not None:
+                btn.setIcon(icon)
             else:
                 btn.setText(icon_name[:2].upper())
             btn.setIconSize(QSize(28, 28))
@@ -563,35 +837,19 @@ class ActivitySidebar(QWidget):
         self._settings_btn = _make_tool("settings", "Settings")
         self._explorer_btn.setChecked(True)
 
-        self._nav_bar.setStyleSheet(
-            self._nav_bar.styleSheet() +
-            "QToolButton { background:transparent; border:0; padding:0; margin:0; color:#cfd2d6; }"
-            "QToolButton:hover { background:#2a2c2f; }"
-            "QToolButton:checked { background:#303336; }"
-            "QToolButton:focus { outline: none; }"
-            "QToolButton:!hover:!checked { background:transparent; }"
-            "QToolButton::menu-indicator { image: none; width:0; height:0; }"
-        )
+        nav_layout.addWidget(self._explorer_btn, 0, 0)
+        nav_layout.addWidget(self._settings_btn, 1, 0)
+        nav_layout.setRowStretch(2, 1)
 
-        buttons_container = QWidget(self._nav_bar)
-        bc_layout = QVBoxLayout(buttons_container)
-        bc_layout.setContentsMargins(0, 0, 0, 0)
-        bc_layout.setSpacing(4)
-        bc_layout.addWidget(self._explorer_btn)
-        bc_layout.addWidget(self._settings_btn)
-        bc_layout.addStretch()
-        nav_layout.addWidget(buttons_container)
-        nav_layout.addStretch()
-
-        # Selection indicator
-        self._indicator = QFrame(buttons_container)
+        # Selection indicator (positioned manually over the active button)
+        self._indicator = QFrame(self._nav_bar)
         self._indicator.setFixedWidth(4)
-        self._indicator.setStyleSheet("background:#2680ff; border:none; border-radius:2px;")
+        self._indicator.setObjectName("sidebar-indicator")
         self._indicator.hide()
 
         # --- Panels ------------------------------------------------------------
         self._stack = QStackedWidget(self)
-        self._stack.setStyleSheet("background:#242629;")
+        self._stack.setObjectName("sidebar-stack")
 
         # Explorer page
         explorer_page = QWidget()
@@ -600,51 +858,34 @@ class ActivitySidebar(QWidget):
         exp_layout.setSpacing(0)
         header = QWidget(explorer_page)
         header.setFixedHeight(24)
-        header.setStyleSheet("background:#242629; border:none;")
+        header.setObjectName("explorer-header")
         hl = QHBoxLayout(header)
         hl.setContentsMargins(8, 0, 4, 0)
         hl.setSpacing(0)
         title_lbl = QLabel("Explorer", header)
-        title_lbl.setStyleSheet("color:#cfd2d6; font-weight:bold; font-size:11px;")
+        title_lbl.setObjectName("explorer-title")
         hl.addWidget(title_lbl)
         hl.addStretch()
+        # shown while a drop/paste/delete runs in the background
+        self._fs_status = QLabel(header)
+        self._fs_status.setObjectName("explorer-fs-status")
+        self._fs_status.hide()
+        hl.addWidget(self._fs_status)
         exp_layout.addWidget(header)
 
-        # Filesystem model (lazy root)
-        self._fs_model = QFileSystemModel(self)
-        try:
-            self._fs_model.setReadOnly(False)
-        except Exception:
-            pass
-        try:
-            from .file_icons import FileIconProvider, file_icon_registry  # type: ignore
-            from .file_icon_config import apply_file_icon_config  # type: ignore
-            apply_file_icon_config()
-            self._fs_model.setIconProvider(FileIconProvider(file_icon_registry))
-        except Exception:
-            class _EmptyIconProvider(QFileIconProvider):
-                def icon(self, *_):
-                    return QIcon()
-            self._fs_model.setIconProvider(_EmptyIconProvider())
-        self._fs_model.setFilter(QDir.AllDirs | QDir.NoDotAndDotDot | QDir.Files)
-
         # Placeholder before a folder is opened
         self._placeholder = QWidget(explorer_page)
         ph_layout = QVBoxLayout(self._placeholder)
         ph_layout.setContentsMargins(20, 30, 20, 20)
         ph_layout.setSpacing(14)
         msg = QLabel("No folder opened", self._placeholder)
-        msg.setStyleSheet("color:#cfd2d6; font-size:13px; font-weight:bold;")
+        msg.setObjectName("explorer-empty-title")
         sub = QLabel("Click the button below to choose a folder to explore.", self._placeholder)
-        sub.setStyleSheet("color:#9ca2a8; font-size:11px;")
+        sub.setObjectName("explorer-empty-hint")
         sub.setWordWrap(True)
         open_btn = QPushButton("Open Folder...", self._placeholder)
         open_btn.setCursor(Qt.PointingHandCursor)
-        open_btn.setStyleSheet(
-            "QPushButton { background:#2f3235; border:1px solid #3a3d41; color:#e3e5e8; padding:6px 14px; border-radius:4px; }"
-            "QPushButton:hover { background:#3a3d41; }"
-            "QPushButton:pressed { background:#45484c; }"
-        )
+        open_btn.setObjectName("explorer-open-btn")
         ph_layout.addWidget(msg)
         ph_layout.addWidget(sub)
         ph_layout.addSpacing(4)
@@ -652,27 +893,113 @@ class ActivitySidebar(QWidget):
         ph_layout.addStretch()
         exp_layout.addWidget(self._placeholder)
 
-        # Tree view (hidden initially)
-        self._tree = _FileTreeView(self, explorer_page)
+        # Model and tree are built on first folder load (_ensure_tree); QFileSystemModel
+        # starts a watcher thread and caches as soon as it exists
+        self._fs_model: QFileSystemModel | None = None
+        self._tree: _FileTreeView | None = None
+        self._explorer_page = explorer_page
+        self._explorer_layout = exp_layout
+        open_btn.clicked.connect(self.open_folder)
+        self._folder_loaded = False
+        self._current_root_path = None  # type: ignore[assignment]
+        self._current_root_abs: str | None = None  # absolute form, computed once per open
+
+        # Settings page is built when first shown (_ensure_settings_page)
+        self._settings_page: QWidget | None = None
+
+        self._stack.addWidget(explorer_page)   # index 0
+
+        root_layout.addWidget(self._nav_bar, 0)
+        root_layout.addWidget(self._stack, 1)
+
+        # Initial state
+        self._panel_visible = True
+        self._active_btn = self._explorer_btn
+        self._pending_indicator = None  # button the indicator moves to on the next tick
+        self._schedule_indicator(self._explorer_btn)
+
+        self._explorer_btn.clicked.connect(lambda: self._activate(self._explorer_btn, 0))
+        self._settings_btn.clicked.connect(lambda: self._activate(self._settings_btn, 1))
+        # clipboard (cut/copy) store
+        self._clipboard_paths = []  # type: ignore[assignment]
+        self._clipboard_mode = None  # type: ignore[assignment]
+        # background file operations (drop/paste/delete): one runs at a time, later ones
+        # wait in the queue so they never race on the same files
+        self._fs_signals = _FsOpSignals(self)
+        self._fs_signals.finished.connect(self._on_fs_op_done)
+        self._fs_queue: list[tuple[str, object]] = []
+        self._fs_running = False
+
+    # --- internal helpers ----------------------------------------------------
+    def _schedule_indicator(self, btn):
+        # Several activations in one event loop pass collapse into a single relayout
+        if self._pending_indicator is None:
+            QTimer.singleShot(0, self._flush_indicator)
+        self._pending_indicator = btn
+
+    def _flush_indicator(self):
+        btn = self._pending_indicator
+        if btn is None:
+            return
+        self._pending_indicator = None
+        self._move_indicator(btn)
+
+    def _move_indicator(self, btn):
+        self._indicator.setFixedHeight(btn.height())
+        self._indicator.move(0, btn.y())
+        if not self._indicator.isVisible():
+            self._indicator.show()
+
+    def _ensure_tree(self):
+        if self._tree is not None:
+            return
+        # Filesystem model
+        self._fs_model = QFileSystemModel(self)
+        try:
+            self._fs_model.setReadOnly(False)
+        except Exception:
+            pass
+        try:
+            from .file_icons import FileIconProvider, file_icon_registry  # type: ignore
+            from .file_icon_config import apply_file_icon_config  # type: ignore
+            apply_file_icon_config()
+            self._fs_model.setIconProvider(FileIconProvider(file_icon_registry))
+        except Exception:
+            class _EmptyIconProvider(QFileIconProvider):
+                _empty = QIcon()
+
+                def icon(self, *_):
+                    return self._empty
+            self._fs_model.setIconProvider(_EmptyIconProvider())
+        self._fs_model.setFilter(QDir.AllDirs | QDir.NoDotAndDotDot | QDir.Files)
+        # Folders are drawn without icons, so skip per-directory custom icon lookups; keep
+        # symlinks as-is instead of resolving each one. File watching stays on: new,
+        # renamed and externally changed entries only show up through the watcher.
+        self._fs_model.setOption(QFileSystemModel.DontUseCustomDirectoryIcons, True)
+        self._fs_model.setOption(QFileSystemModel.DontResolveSymlinks, True)
+
+        # Tree view (hidden until the folder is loaded)
+        self._tree = _FileTreeView(self, self._explorer_page)
         self._tree.hide()
         self._tree.setModel(self._fs_model)
         self._tree.setHeaderHidden(True)
+        # Only the name column is shown; QFileSystemModel's column set is fixed, so the
+        # others are hidden once here rather than on every folder load
+        header = self._tree.header()
+        header.setStretchLastSection(False)
+        header.setSectionResizeMode(0, QHeaderView.Stretch)
+        for c in range(1, self._fs_model.columnCount()):
+            header.hideSection(c)
         self._tree.setIndentation(14)
-        self._tree.setAnimated(True)
+        # No expand animation: it repaints the subtree every frame, which adds up for
+        # big folders (and QFileSystemModel fills children after the expand anyway)
+        self._tree.setAnimated(False)
         self._tree.setIconSize(QSize(14, 14))
-        resources_dir = Path(__file__).resolve().parent.parent / "resources" / "icons"
-        chevron_right = (resources_dir / "chevron_right.svg").as_posix()
-        chevron_down = (resources_dir / "chevron_down.svg").as_posix()
-        self._tree.setStyleSheet(
-            "QTreeView { background:#242629; color:#e3e5e8; border:none; outline:0; padding:0; font-size:13px; }"
-            "QTreeView::viewport { margin:0; }"
-            "QTreeView::item { padding:1px 4px; border:0; }"
-            "QTreeView::item:hover { background:#33373b; }"
-            "QTreeView::item:selected { background:#3a3f45; }"
-            "QTreeView::branch { background: transparent; margin-left:0px; }"
-            f"QTreeView::branch:has-children:!has-siblings:closed,QTreeView::branch:closed:has-children {{ image: url({chevron_right}); }}"
-            f"QTreeView::branch:open:has-children:!has-siblings,QTreeView::branch:open:has-children {{ image: url({chevron_down}); }}"
-        )
+        # Uniform rows let Qt map y -> row arithmetically instead of walking items
+        self._tree.setUniformRowHeights(True)
+        self._tree.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self._tree.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self._tree.setObjectName("explorer-tree")  # styled by _SIDEBAR_QSS
         # Increase tree view font size
         try:
             _f = self._tree.font()
@@ -686,57 +1013,81 @@ class ActivitySidebar(QWidget):
             pass
         self._tree.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         self._tree.setCursor(Qt.PointingHandCursor)
-        self._tree.setCursor(Qt.PointingHandCursor)
-        exp_layout.addWidget(self._tree)
+        self._explorer_layout.addWidget(self._tree)
+        # Folders expand natively on double-click; activation (double-click / Enter)
+        # opens files, so plain clicks never leave Qt
+        self._tree.setExpandsOnDoubleClick(True)
+        self._tree.activated.connect(self._on_tree_activated)
+
+    def _queue_drops(self, sources: list[str], target_dir: str, root_abs: str):
+        if not sources:
+            return
+        def _run():
+            return [os.path.dirname(p) for p in _perform_drops(sources, target_dir, root_abs)]
+        self._queue_fs_op(_count_text("Transferring", len(sources)), _run)
+
+    def _queue_fs_op(self, status: str, func):
+        self._fs_queue.append((status, func))
+        if not self._fs_running:
+            self._start_next_fs_op()
+
+    def _start_next_fs_op(self):
+        status, func = self._fs_queue.pop(0)
+        self._fs_running = True
+        self._fs_status.setText(status)
+        self._fs_status.show()
+        QThreadPool.globalInstance().start(_FsOpJob(func, self._fs_signals))
+
+    def _on_fs_op_done(self, touched: list):
+        self._fs_running = False
+        if touched:
+            self._refresh_dirs(set(touched))
+        if self._fs_queue:
+            self._start_next_fs_op()
+        else:
+            self._fs_status.hide()
 
-        def _toggle(idx):
-            if self._fs_model.isDir(idx):
-                if self._tree.isExpanded(idx):
-                    self._tree.collapse(idx)
-                else:
-                    self._tree.expand(idx)
-            else:
-                path = self._fs_model.filePath(idx)
-                if path:
-                    self.fileActivated.emit(path)
-        self._tree.clicked.connect(_toggle)
-        open_btn.clicked.connect(self.open_folder)
-        self._folder_loaded = False
-        self._current_root_path = None  # type: ignore[assignment]
+    def _refresh_dirs(self, dirs):
+        """Bring the model up to date after files were changed in ``dirs``.
+
+        QFileSystemModel's watcher reports changes in directories it has listed, so
+        only a directory that was never listed needs fetching. Without the watcher the
+        whole model is reloaded.
+        """
+        model = self._fs_model
+        if model is None:
+            return
+        if model.testOption(QFileSystemModel.DontWatchForChanges):
+            current = model.rootPath()
+            model.setRootPath("")
+            model.setRootPath(current)
+            return
+        for d in dirs:
+            idx = model.index(d)
+            if idx.isValid() and model.canFetchMore(idx):
+                model.fetchMore(idx)
+
+    def _on_tree_activated(self, idx):
+        if self._fs_model.isDir(idx):
+            return
+        path = self._fs_model.filePath(idx)
+        if path:
+            self.fileActivated.emit(path)
 
+    def _ensure_settings_page(self):
+        if self._settings_page is not None:
+            return
         # Settings page (placeholder)
         settings_page = QWidget()
         sl = QVBoxLayout(settings_page)
         sl.setContentsMargins(8, 8, 8, 8)
         sl.setSpacing(4)
         ph = QLabel("Settings panel (placeholder)", settings_page)
-        ph.setStyleSheet("color:#cfd2d6; font-size:12px;")
+        ph.setObjectName("settings-placeholder")
         sl.addWidget(ph)
         sl.addStretch()
-
-        self._stack.addWidget(explorer_page)   # index 0
         self._stack.addWidget(settings_page)   # index 1
-
-        root_layout.addWidget(self._nav_bar, 0)
-        root_layout.addWidget(self._stack, 1)
-
-        # Initial state
-        self._panel_visible = True
-        self._active_btn = self._explorer_btn
-        self._move_indicator(self._explorer_btn)
-
-        self._explorer_btn.clicked.connect(lambda: self._activate(self._explorer_btn, 0))
-        self._settings_btn.clicked.connect(lambda: self._activate(self._settings_btn, 1))
-        # clipboard (cut/copy) store
-        self._clipboard_paths = []  # type: ignore[assignment]
-        self._clipboard_mode = None  # type: ignore[assignment]
-
-    # --- internal helpers ----------------------------------------------------
-    def _move_indicator(self, btn):
-        self._indicator.setFixedHeight(btn.height())
-        self._indicator.move(0, btn.y())
-        if not self._indicator.isVisible():
-            self._indicator.show()
+        self._settings_page = settings_page
 
     def _activate(self, btn, idx: int):
         if btn is self._active_btn and self._panel_visible:
@@ -745,6 +1096,7 @@ class ActivitySidebar(QWidget):
             self._panel_visible = False
             btn.setChecked(False)
             self._active_btn = None
+            self._pending_indicator = None
             self._indicator.hide()
             self.panelHidden.emit()
             return
@@ -756,9 +1108,11 @@ class ActivitySidebar(QWidget):
             self._active_btn.setChecked(False)
         btn.setChecked(True)
         self._active_btn = btn
+        if idx == 1:
+            self._ensure_settings_page()
         self._stack.setCurrentIndex(idx)
         if self._panel_visible:
-            self._move_indicator(btn)
+            self._schedule_indicator(btn)
         self.currentPanelChanged.emit(idx)
 
     # --- public API ----------------------------------------------------------
@@ -792,26 +1146,24 @@ class ActivitySidebar(QWidget):
         self._placeholder.show()
         self._folder_loaded = False
         self._current_root_path = None
-        # Clear root index (optional visual reset)
-        try:
-            empty_idx = self._fs_model.setRootPath("")  # might be invalid, safe fallback
-            self._tree.setRootIndex(empty_idx)
-        except Exception:
-            pass
+        self._current_root_abs = None
+        # Detach the (hidden) view only; the model keeps its root path and cached
+        # listings, so reopening the same folder does not re-enumerate it
+        self._tree.setRootIndex(QModelIndex())
 
     # --- state save/restore ----------------------------------------------
     def _load_folder_path(self, path: str):
         """Internal helper to load a folder without prompting."""
         if not path:
             return
+        self._ensure_tree()
         idx = self._fs_model.setRootPath(path)
         self._tree.setRootIndex(idx)
-        for c in range(1, self._fs_model.columnCount()):  # hide extra columns
-            self._tree.setColumnHidden(c, True)
         self._placeholder.hide()
         self._tree.show()
         self._folder_loaded = True
         self._current_root_path = path
+        self._current_root_abs = os.path.abspath(path)
         self.folderOpened.emit(path)
 
     def save_state(self) -> dict:
@@ -826,27 +1178,27 @@ class ActivitySidebar(QWidget):
         state: dict[str, object] = {"folder": None, "expanded": []}
         if not self._folder_loaded or not self._current_root_path:
             return state
-        root_path = Path(self._current_root_path)
+        root_str = str(Path(self._current_root_path))
         expanded: list[str] = []
-
-        def _recurse(parent_index):
-            rows = self._fs_model.rowCount(parent_index)
-            for r in range(rows):
-                idx = self._fs_model.index(r, 0, parent_index)
-                if not idx.isValid():
-                    continue
-                p = Path(self._fs_model.filePath(idx))
-                if self._fs_model.isDir(idx):
-                    if self._tree.isExpanded(idx):
-                        try:
-                            rel = p.relative_to(root_path)
-                            expanded.append(rel.as_posix())
-                        except Exception:
-                            pass
-                        _recurse(idx)
-        root_index = self._tree.rootIndex()
-        _recurse(root_index)
-        state["folder"] = str(root_path)
+        model = self._fs_model
+        tree = self._tree
+        root_index = tree.rootIndex()
+        # model paths always use '/'; relative paths are a slice past this prefix
+        prefix = model.filePath(root_index).rstrip('/') + '/'
+        cut = len(prefix)
+        # Iterative walk that only descends into expanded dirs (a collapsed subtree
+        # cannot hold expanded children, and listing it would make the model fetch it)
+        stack = [root_index]
+        while stack:
+            parent = stack.pop()
+            for r in range(model.rowCount(parent)):
+                idx = model.index(r, 0, parent)
+                if model.isDir(idx) and tree.isExpanded(idx):
+                    p = model.filePath(idx)
+                    if p.startswith(prefix):
+                        expanded.append(p[cut:])
+                    stack.append(idx)
+        state["folder"] = root_str
         state["expanded"] = expanded
         return state
 
@@ -863,16 +1215,23 @@ class ActivitySidebar(QWidget):
         if not isinstance(expanded, list):
             return
         root_path = Path(folder)
-        for rel in expanded:
-            try:
-                full = (root_path / rel).resolve()
-            except Exception:
-                continue
-            if not full.exists():
-                continue
-            idx = self._fs_model.index(str(full))
-            if idx.isValid():
-                self._tree.expand(idx)
+        tree = self._tree
+        # one relayout/repaint for the whole batch instead of one per expanded folder
+        tree.setUpdatesEnabled(False)
+        try:
+            for rel in expanded:
+                try:
+                    full = (root_path / rel).resolve()
+                except Exception:
+                    continue
+                if not full.exists():
+                    continue
+                idx = self._fs_model.index(str(full))
+                if idx.isValid():
+                    tree.expand(idx)
+        finally:
+            tree.setUpdatesEnabled(True)
+            tree.viewport().update()
 
 
 __all__ = ["ActivitySidebar"]
@@ -1,4 +1,5 @@
 from __future__ import annotations
+from functools import lru_cache
 from pathlib import Path
 
 from PySide6.QtCore import Qt, QSize, Signal
@@ -13,6 +14,13 @@ from PySide6.QtWidgets import (
 from .code_editor import CodeEditor
 
 
+@lru_cache(maxsize=1)
+def _close_icon() -> QIcon:
+    # Resolved and loaded once; a null icon means the close button falls back to text
+    svg_path = Path(__file__).resolve().parent.parent / 'resources' / 'icons' / 'close.svg'
+    return QIcon(str(svg_path)) if svg_path.exists() else QIcon()
+
+
 class _HoverCloseTabBar(QTabBar):
     """Custom tab bar showing:
     - Close button always on the selected tab
@@ -21,11 +29,14 @@ class _HoverCloseTabBar(QTabBar):
     - Stable tab widths (placeholder button for all tabs)
     """
 
+    _ICON_SIZE = QSize(12, 12)
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setMouseTracking(True)
         self._hover_index: int = -1
         self._active_close_indices: set[int] = set()
+        self._cursor_shape = Qt.ArrowCursor  # shape last set on the bar
 
     # ---- placeholder mgmt -------------------------------------------------
     def _ensure_placeholder(self, index: int):
@@ -60,25 +71,28 @@ class _HoverCloseTabBar(QTabBar):
     # ---- events -----------------------------------------------------------
     def mouseMoveEvent(self, event: QMouseEvent):  # type: ignore[override]
         idx = self.tabAt(event.position().toPoint() if hasattr(event, "position") else event.pos())
-        if idx != self._hover_index:
-            self._hover_index = idx
-            self._update_close_buttons()
+        if idx == self._hover_index:
+            # still over the same tab (or gap): buttons and cursor are already right
+            super().mouseMoveEvent(event)
+            return
+        self._hover_index = idx
+        self._update_close_buttons()
         # cursor
-        if idx >= 0:
-            if self.cursor().shape() != Qt.PointingHandCursor:
-                self.setCursor(Qt.PointingHandCursor)
-        else:
-            if self.cursor().shape() != Qt.ArrowCursor:
-                self.setCursor(Qt.ArrowCursor)
+        self._set_cursor_shape(Qt.PointingHandCursor if idx >= 0 else Qt.ArrowCursor)
         super().mouseMoveEvent(event)
 
     def leaveEvent(self, event):  # type: ignore[override]
         self._hover_index = -1
         self._update_close_buttons()
-        if self.cursor().shape() != Qt.ArrowCursor:
-            self.setCursor(Qt.ArrowCursor)
+        self._set_cursor_shape(Qt.ArrowCursor)
         super().leaveEvent(event)
 
+    def _set_cursor_shape(self, shape):
+        # compare against the cached shape instead of copying a QCursor via cursor()
+        if shape != self._cursor_shape:
+            self._cursor_shape = shape
+            self.setCursor(shape)
+
     # ---- core logic -------------------------------------------------------
     def _update_close_buttons(self):
         self._ensure_all_placeholders()
@@ -98,11 +112,10 @@ class _HoverCloseTabBar(QTabBar):
             close_btn.setAutoRaise(True)
             close_btn.setCursor(Qt.PointingHandCursor)
             close_btn.setFixedSize(14, 14)
-            svg_path = Path(__file__).resolve().parent.parent / 'resources' / 'icons' / 'close.svg'
-            icon = QIcon(str(svg_path)) if svg_path.exists() else QIcon()
+            icon = _close_icon()
             if not icon.isNull():
                 close_btn.setIcon(icon)
-                close_btn.setIconSize(QSize(12, 12))
+                close_btn.setIconSize(self._ICON_SIZE)
             else:
                 close_btn.setText('×')
             close_btn.setAccessibleName('Close')